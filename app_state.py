@@ -2,7 +2,7 @@
 
 import json
 import pathlib
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 
 from modules.presets import PresetManager
 from modules.logging_config import get_logger, set_log_level
@@ -15,13 +15,33 @@ class AppState:
     """Central application state manager to replace global variables."""
     
     def __init__(self):
-        self.video_list: List[str] = []
+        self._video_list: List[str] = []
+        # When set, video_list is stale and this rebuilds it on next access
+        self._video_list_source: Optional[Callable[[], List[str]]] = None
         self.selected_video: Optional[pathlib.Path] = None
         self.config: Dict[str, Any] = {}
         self.working_dir: Optional[pathlib.Path] = None
         self.main_frame: Any = None  # Will be set to MyFrame instance (avoid typing conflicts)
         self.preset_manager: Optional[PresetManager] = None
+        self.ffmpeg_checked: bool = False  # Set once FFmpeg tools have been found
         
+    @property
+    def video_list(self) -> List[str]:
+        """Absolute paths of the checked videos, in display order."""
+        if self._video_list_source is not None:
+            self._video_list = self._video_list_source()
+            self._video_list_source = None
+        return self._video_list
+
+    @video_list.setter
+    def video_list(self, paths: List[str]):
+        self._video_list = paths
+        self._video_list_source = None
+
+    def invalidate_video_list(self, source: Callable[[], List[str]]):
+        """Mark video_list as changed; source() rebuilds it when it's next read."""
+        self._video_list_source = source
+
     def load_config(self):
         """Load configuration from config.json file."""
         config_file = pathlib.Path(__file__).parent / "config.json"
@@ -5,7 +5,7 @@ import pathlib
 from typing import TYPE_CHECKING
 
 import modules.video as video
-from modules.video import VIDEO_EXTENSIONS
+from modules.video import VIDEO_EXTENSIONS, VIDEO_EXT_LIST, VIDEO_EXT_INDEX
 from modules.output import OutputPathGenerator, OutputPreset, OUTPUT_PRESETS
 
 if TYPE_CHECKING:
@@ -88,7 +88,7 @@ class OutputOptionsDialog(wx.Dialog):
         
         ext_sizer = wx.BoxSizer(wx.HORIZONTAL)
         ext_sizer.Add(wx.StaticText(panel, label="Extension:"), 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
-        self.extension_choice = wx.ComboBox(panel, choices=list(VIDEO_EXTENSIONS), style=wx.CB_READONLY)
+        self.extension_choice = wx.ComboBox(panel, choices=VIDEO_EXT_LIST, style=wx.CB_READONLY)
         ext_sizer.Add(self.extension_choice, 1, wx.ALL | wx.EXPAND, 5)
         
         naming_box.Add(suffix_sizer, 0, wx.EXPAND | wx.ALL, 3)
@@ -235,13 +235,9 @@ Result: movie_h265_crf23.mkv"""
         self.suffix_ctrl.SetValue(self.output_generator.suffix)
         
         # Find matching extension
-        try:
-            extension_list = list(VIDEO_EXTENSIONS)
-            if self.output_generator.extension in extension_list:
-                ext_index = extension_list.index(self.output_generator.extension)
-                self.extension_choice.SetSelection(ext_index)
-        except (ValueError, AttributeError):
-            pass
+        ext_index = VIDEO_EXT_INDEX.get(self.output_generator.extension)
+        if ext_index is not None:
+            self.extension_choice.SetSelection(ext_index)
         
         # Set checkboxes
         self.include_resolution_check.SetValue(self.output_generator.include_resolution)
@@ -338,7 +334,7 @@ Result: movie_h265_crf23.mkv"""
         # Basic naming
         self.output_generator.set_naming_options(
             suffix=self.suffix_ctrl.GetValue(),
-            extension=list(VIDEO_EXTENSIONS)[self.extension_choice.GetSelection()],
+            extension=VIDEO_EXTENSIONS[self.extension_choice.GetSelection()],
             include_resolution=self.include_resolution_check.GetValue(),
             include_codec=self.include_codec_check.GetValue(),
             include_quality=self.include_quality_check.GetValue(),
@@ -4,7 +4,7 @@ import wx
 import pathlib
 from typing import TYPE_CHECKING
 
-from modules.video import VIDEO_EXTENSIONS
+from modules.video import VIDEO_EXTENSIONS, VIDEO_EXT_LIST
 
 if TYPE_CHECKING:
     from app_state import AppState
@@ -172,7 +172,7 @@ class SelectionOptionsDialog(wx.Dialog):
         ext_choice_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self.ext_condition = wx.Choice(panel, choices=["that are", "that are NOT"])
         self.ext_condition.SetSelection(0)
-        self.ext_choice = wx.Choice(panel, choices=list(VIDEO_EXTENSIONS))
+        self.ext_choice = wx.Choice(panel, choices=VIDEO_EXT_LIST)
         self.ext_choice.SetSelection(0)
         
         ext_choice_sizer.Add(wx.StaticText(panel, label="Videos "), 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 2)
@@ -243,8 +243,7 @@ class SelectionOptionsDialog(wx.Dialog):
             return
         
         # First, unselect all items
-        for i in range(self.listbox.video_list.GetItemCount()):
-            self.listbox.video_list.CheckItem(i, False)
+        self.listbox.video_list.check_all(False)
         
         selected_count = 0
         
@@ -324,7 +323,7 @@ class SelectionOptionsDialog(wx.Dialog):
             
             # Extension filter
             if self.select_by_extension.GetValue():
-                target_ext = list(VIDEO_EXTENSIONS)[self.ext_choice.GetSelection()]
+                target_ext = VIDEO_EXTENSIONS[self.ext_choice.GetSelection()]
                 file_ext = pathlib.Path(filename).suffix.lower()
                 
                 has_ext = (file_ext == target_ext)
@@ -234,18 +234,20 @@ class MyFrame(wx.Frame):
     def OnClose(self, event):
         """Handle application close."""
         pane = self.reencode_pane
-        self.app_state.config["output_extension"] = pane.extension_choice.GetStringSelection()
-        self.app_state.config["output_suffix"] = pane.suffix_textbox.GetValue()
-        self.app_state.config["append_res"] = pane.append_res_checkbox.GetValue()
-        self.app_state.config["encode_video"] = pane.vcodec_checkbox.GetValue()
-        self.app_state.config["video_codec"] = pane.vcodec_choice.GetStringSelection()
-        self.app_state.config["encode_audio"] = pane.acodec_checkbox.GetValue()
-        self.app_state.config["audio_codec"] = pane.acodec_choice.GetStringSelection()
-        self.app_state.config["no_data"] = pane.exclude_data_streams.GetValue()
-        self.app_state.config["fix_resolution"] = pane.fix_res.GetValue()
-        self.app_state.config["fix_err"] = pane.fix_errors.GetValue()
-        self.app_state.config["use_crf"] = pane.crf_checkbox.GetValue()
-        self.app_state.config["crf_value"] = str(pane.crf_int.GetValue())
+        # The reencode controls only exist once the pane has been expanded
+        if pane.ui_built:
+            self.app_state.config["output_extension"] = pane.extension_choice.GetStringSelection()
+            self.app_state.config["output_suffix"] = pane.suffix_textbox.GetValue()
+            self.app_state.config["append_res"] = pane.append_res_checkbox.GetValue()
+            self.app_state.config["encode_video"] = pane.vcodec_checkbox.GetValue()
+            self.app_state.config["video_codec"] = pane.vcodec_choice.GetStringSelection()
+            self.app_state.config["encode_audio"] = pane.acodec_checkbox.GetValue()
+            self.app_state.config["audio_codec"] = pane.acodec_choice.GetStringSelection()
+            self.app_state.config["no_data"] = pane.exclude_data_streams.GetValue()
+            self.app_state.config["fix_resolution"] = pane.fix_res.GetValue()
+            self.app_state.config["fix_err"] = pane.fix_errors.GetValue()
+            self.app_state.config["use_crf"] = pane.crf_checkbox.GetValue()
+            self.app_state.config["crf_value"] = str(pane.crf_int.GetValue())
         self.app_state.config["recursion_depth"] = self.recursion_spin.GetValue()
         self.app_state.config["working_dir"] = str(self.app_state.working_dir) if self.app_state.working_dir else str(pathlib.Path.cwd())
         self.Destroy()
@@ -296,12 +298,10 @@ class MyFrame(wx.Frame):
             
             if checkbox_state == wx.CHK_CHECKED:
                 # Checkbox is now checked (showing "Select All") - select all items
-                for i in range(total_items):
-                    self.listbox.video_list.CheckItem(i, True)
+                self.listbox.video_list.check_all(True)
             else:
                 # Checkbox is now unchecked or indeterminate - deselect all items  
-                for i in range(total_items):
-                    self.listbox.video_list.CheckItem(i, False)
+                self.listbox.video_list.check_all(False)
             
             # Call OnChecked to update the video list and trigger checkbox update
             self.listbox.video_list.OnChecked(event)
@@ -320,10 +320,8 @@ class MyFrame(wx.Frame):
             self.select_all_checkbox.Set3StateValue(wx.CHK_UNCHECKED)
             return
             
-        selected_count = 0
-        for i in range(total_items):
-            if self.listbox.video_list.IsItemChecked(i):
-                selected_count += 1
+        # Counted from the list's checked set, so this doesn't force video_list to be rebuilt
+        selected_count = self.listbox.video_list.checked_count()
         
         if selected_count == 0:
             self.select_all_checkbox.Set3StateValue(wx.CHK_UNCHECKED)
@@ -334,15 +332,13 @@ class MyFrame(wx.Frame):
 
     def OnSelectAll(self, event):
         """Select all videos."""
-        for i in range(self.listbox.video_list.GetItemCount()):
-            self.listbox.video_list.CheckItem(i)
+        self.listbox.video_list.check_all(True)
         self.listbox.video_list.OnChecked(event)
         self.UpdateSelectAllCheckbox()
 
     def OnSelectNone(self, event):
         """Deselect all videos."""
-        for i in range(self.listbox.video_list.GetItemCount()):
-            self.listbox.video_list.CheckItem(i, False)
+        self.listbox.video_list.check_all(False)
         self.listbox.video_list.OnChecked(event)
         self.UpdateSelectAllCheckbox()
 
@@ -18,6 +18,7 @@ class OutputPathGenerator:
     
     def __init__(self):
         self.output_directory: Optional[pathlib.Path] = None
+        self.output_directory_str: str = ""  # String form of output_directory, "" if unset
         self.subdirectory_pattern: str = ""
         self.filename_pattern: str = "{stem}{suffix}{extension}"
         self.suffix: str = "_encoded"
@@ -31,7 +32,12 @@ class OutputPathGenerator:
         
     def set_output_directory(self, directory: Optional[pathlib.Path]):
         """Set the base output directory. None means same as input."""
-        self.output_directory = directory
+        if directory:
+            self.output_directory = pathlib.Path(directory)
+            self.output_directory_str = str(self.output_directory)
+        else:
+            self.output_directory = None
+            self.output_directory_str = ""
         
     def set_subdirectory_pattern(self, pattern: str):
         """Set pattern for creating subdirectories. Examples:
@@ -0,0 +1,120 @@
+"""
+Persistent cache of ffprobe metadata, so unchanged files aren't re-probed across runs.
+"""
+
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from .logging_config import get_logger
+
+# Module logger
+logger = get_logger('probe_cache')
+
+
+def default_cache_file() -> pathlib.Path:
+    """Return the default cache location, honouring XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return pathlib.Path(cache_home) / "vidtool" / "probe_cache.sqlite"
+
+
+class ProbeCache:
+    """ffprobe metadata stored in sqlite, keyed by (path, mtime_ns, size).
+
+    All rows are read into memory on first use; new probes are written back in batches.
+    Any database error just disables the cache, since it is only an optimisation.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None):
+        self.cache_file = pathlib.Path(cache_file) if cache_file else default_cache_file()
+        self._entries: Dict[str, Tuple[int, int, str]] = {}  # path -> (mtime_ns, size, metadata json)
+        self._loaded = False
+        self._enabled = True
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.cache_file))
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS probe "
+            "(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, metadata TEXT)"
+        )
+        return conn
+
+    def _disable(self, action, e):
+        logger.warning(f"Probe cache disabled after failing to {action} {self.cache_file}: {e}")
+        self._enabled = False
+
+    def load(self) -> None:
+        """Read the cache file into memory, once."""
+        with self._lock:
+            if self._loaded or not self._enabled:
+                return
+            self._loaded = True
+            try:
+                conn = self._connect()
+                try:
+                    for path, mtime_ns, size, metadata in conn.execute(
+                            "SELECT path, mtime_ns, size, metadata FROM probe"):
+                        self._entries[path] = (mtime_ns, size, metadata)
+                finally:
+                    conn.close()
+                logger.debug(f"Loaded {len(self._entries)} probe cache entries from {self.cache_file}")
+            except (sqlite3.Error, OSError) as e:
+                self._disable("read", e)
+
+    def get(self, path: str, st: os.stat_result) -> Optional[dict]:
+        """Return the cached metadata for path if its mtime and size still match st."""
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+            return None
+        try:
+            return json.loads(entry[2])
+        except ValueError:
+            return None
+
+    def store(self, items: Iterable[Tuple[str, os.stat_result, dict]]) -> None:
+        """Save (path, stat, metadata) for newly probed files."""
+        rows = [(path, st.st_mtime_ns, st.st_size, json.dumps(metadata)) for path, st, metadata in items]
+        if not rows:
+            return
+        with self._lock:
+            for path, mtime_ns, size, metadata in rows:
+                self._entries[path] = (mtime_ns, size, metadata)
+            if not self._enabled:
+                return
+            try:
+                conn = self._connect()
+                try:
+                    with conn:
+                        conn.executemany("INSERT OR REPLACE INTO probe VALUES (?, ?, ?, ?)", rows)
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError) as e:
+                self._disable("write", e)
+
+    def prune(self, directory: str, present: Iterable[str]) -> None:
+        """Drop entries under directory for files that no longer exist."""
+        prefix = os.path.join(directory, "")
+        present = set(present)
+        with self._lock:
+            stale = [path for path in self._entries
+                     if path.startswith(prefix) and path not in present and not os.path.exists(path)]
+            if not stale:
+                return
+            for path in stale:
+                del self._entries[path]
+            if not self._enabled:
+                return
+            try:
+                conn = self._connect()
+                try:
+                    with conn:
+                        conn.executemany("DELETE FROM probe WHERE path = ?", [(path,) for path in stale])
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError) as e:
+                self._disable("write", e)
@@ -109,6 +109,14 @@ AUDIO_CODECS = (
     "copy", "aac", "mp3", "flac", "ogg", "ac3", "opus"
 )
 
+# Position lookups for the tuples above, used to select entries in choice controls
+VIDEO_EXT_LIST = list(VIDEO_EXTENSIONS)
+VIDEO_CODEC_LIST = list(VIDEO_CODECS)
+AUDIO_CODEC_LIST = list(AUDIO_CODECS)
+VIDEO_EXT_INDEX = {ext: i for i, ext in enumerate(VIDEO_EXTENSIONS)}
+VIDEO_CODEC_INDEX = {codec: i for i, codec in enumerate(VIDEO_CODECS)}
+AUDIO_CODEC_INDEX = {codec: i for i, codec in enumerate(AUDIO_CODECS)}
+
 def execute(command, callback=None, progress_callback=None, cancel_event=None):
     """
     Execute a command using subprocess with enhanced error handling and progress tracking.
@@ -209,20 +217,24 @@ def play(video):
 
 class info:
     """Extracts and holds metadata for a video file with comprehensive error handling."""
-    def __init__(self, file):
+    def __init__(self, file, metadata=None):
+        """Probe file with ffprobe, or build from previously probed metadata if given."""
         self.file = file
         
-        # Validate file exists and is readable
-        if not pathlib.Path(file).exists():
-            raise VideoFileError(f"Video file not found: {file}")
-        
-        if not pathlib.Path(file).is_file():
-            raise VideoFileError(f"Path is not a file: {file}")
+        if metadata is not None:
+            self.metadata = metadata
+        else:
+            # Validate file exists and is readable
+            if not pathlib.Path(file).exists():
+                raise VideoFileError(f"Video file not found: {file}")
             
-        try:
-            self.metadata = self.get_metadata(file)
-        except Exception as e:
-            raise VideoFileError(f"Failed to extract metadata from '{file}': {e}")
+            if not pathlib.Path(file).is_file():
+                raise VideoFileError(f"Path is not a file: {file}")
+                
+            try:
+                self.metadata = self.get_metadata(file)
+            except Exception as e:
+                raise VideoFileError(f"Failed to extract metadata from '{file}': {e}")
             
         self.format_info = self.metadata.get("format", {})
         streams = self.metadata.get("streams", [])
@@ -233,9 +245,13 @@ class info:
         self.subtitle_streams = [s for s in streams if s.get("codec_type") == "subtitle"]
         self.data_streams = [s for s in streams if s.get("codec_type") == "data"]
         
+        # Joined stream descriptions, built on first use by get_stream_descriptions()
+        self._desc_cache = {}
+        
         try:
             self.max_width, self.max_height = self.get_video_dimensions()
             self.duration = float(self.format_info.get("duration", 0))
+            self.total_duration_ms = self.duration * 1000
             self.size = int(self.format_info.get("size", 0))
             self.size_kb = self.size / 1024
             self.size_mb = self.size_kb / 1024
@@ -275,13 +291,11 @@ class info:
             raise VideoProcessingError(f"Unexpected error running ffprobe: {e}")
 
     def get_video_dimensions(self):
-        max_width = max_height = 0
-        for stream in self.video_streams:
-            temp_width = int(stream.get('width', stream.get('coded_width', 0)))
-            temp_height = int(stream.get('height', stream.get('coded_height', 0)))
-            max_width = max(max_width, temp_width)
-            max_height = max(max_height, temp_height)
-        return max_width, max_height
+        dims = [(int(s.get('width') or s.get('coded_width') or 0),
+                 int(s.get('height') or s.get('coded_height') or 0))
+                for s in self.video_streams]
+        return (max((w for w, _ in dims), default=0),
+                max((h for _, h in dims), default=0))
 
     def print_json(self):
         print(json.dumps(self.metadata, indent=4))
@@ -312,6 +326,16 @@ class info:
     def get_data_stream_description(self, stream):
         return f'#{stream.get("index", "?")} {stream.get("codec_type", "?")}: {stream.get("codec_long_name", "?")}'
 
+    def get_stream_descriptions(self, stream_type):
+        """Return the newline-joined descriptions for "video", "audio", "subtitle" or "data" streams."""
+        desc = self._desc_cache.get(stream_type)
+        if desc is None:
+            describe = getattr(self, f"get_{stream_type}_stream_description")
+            streams = getattr(self, f"{stream_type}_streams")
+            desc = "\n".join(describe(s) for s in streams).strip()
+            self._desc_cache[stream_type] = desc
+        return desc
+
     def get_info_block(self):
         info_block = f'{self.format_info.get("filename", "?")} - {self.format_info.get("format_name", "?")} - {self.format_info.get("format_long_name", "?")}, Runtime = {self.runtime}\n'
         if self.max_width % 2 or self.max_height % 2:
@@ -345,6 +369,44 @@ class info:
             logger.info(f"Renaming: {p} -> {new_path}")
             p.rename(new_path)
 
+# Recently probed files: path -> ((mtime_ns, size), info). Oldest entries are evicted first.
+INFO_CACHE_SIZE = 256
+_info_cache = {}
+_info_cache_lock = threading.Lock()
+
+
+def cached_info(file):
+    """Return info(file), reusing the previous result while the file's mtime and size are unchanged."""
+    path = str(file)
+    try:
+        st = os.stat(path)
+    except OSError:
+        # Let info() raise the appropriate VideoFileError
+        return info(path)
+    key = (st.st_mtime_ns, st.st_size)
+
+    with _info_cache_lock:
+        entry = _info_cache.pop(path, None)
+        if entry and entry[0] == key:
+            _info_cache[path] = entry  # Re-insert as most recently used
+            return entry[1]
+
+    result = info(path)
+    with _info_cache_lock:
+        _info_cache[path] = (key, result)
+        while len(_info_cache) > INFO_CACHE_SIZE:
+            _info_cache.pop(next(iter(_info_cache)))
+    return result
+
+
+def forget_cached_info(file=None):
+    """Drop the cached info for a file, or the whole cache if no file is given."""
+    with _info_cache_lock:
+        if file is None:
+            _info_cache.clear()
+        else:
+            _info_cache.pop(str(file), None)
+
 class encode:
     """Builds and runs ffmpeg encode commands with comprehensive error handling."""
     def __init__(self):
@@ -366,19 +428,7 @@ class encode:
         
     def calculate_total_duration(self):
         """Calculate total duration of all input files in milliseconds."""
-        total_ms = 0
-        for file_info in self.file_info:
-            if hasattr(file_info, 'runtime') and file_info.runtime:
-                # Parse runtime format like "00:01:23.45" 
-                try:
-                    time_parts = file_info.runtime.split(':')
-                    if len(time_parts) >= 3:
-                        hours = int(time_parts[0])
-                        minutes = int(time_parts[1])
-                        seconds = float(time_parts[2])
-                        total_ms += (hours * 3600 + minutes * 60 + seconds) * 1000
-                except (ValueError, IndexError):
-                    pass
+        total_ms = sum(file_info.total_duration_ms for file_info in self.file_info)
         self.total_duration_ms = total_ms
         return total_ms
 
@@ -388,23 +438,32 @@ class encode:
     def parsable_output(self):
         self.arguments += ['-stats', '-loglevel', 'error', '-progress', '-']
 
-    def add_input(self, input_file):
-        """Add input file with validation."""
+    def add_input(self, input_file, resolve_symlinks=False, file_info=None):
+        """Add input file with validation.
+
+        The path is made absolute lexically unless resolve_symlinks is set,
+        which avoids a readlink walk per input on network filesystems. Pass
+        file_info if the file has already been probed; otherwise the probe
+        comes from cached_info().
+        """
         input_path = pathlib.Path(input_file)
-        
+
         if not input_path.exists():
             raise VideoFileError(f"Input file not found: {input_file}")
-            
+
         if not input_path.is_file():
             raise VideoFileError(f"Input path is not a file: {input_file}")
-        
-        self.input.append(str(input_path.resolve()))
+
+        if resolve_symlinks:
+            self.input.append(str(input_path.resolve()))
+        else:
+            self.input.append(os.path.abspath(input_file))
         
         # Only get info for video files, not subtitle files
         if input_path.suffix.lower() not in [".srt", ".vtt", ".ass", ".ssa"]:
             logger.info(f"Adding input file: {input_file}")
             try:
-                self.file_info.append(info(input_file))
+                self.file_info.append(file_info if file_info is not None else cached_info(input_file))
             except Exception as e:
                 logger.warning(f"Could not get info for {input_file}: {e}")
 
@@ -467,6 +526,9 @@ class encode:
     def set_crf(self, crf):
         self.arguments += ['-crf', crf]
 
+    def set_threads(self, threads):
+        self.arguments += ['-threads', str(threads)]
+
     def fix_resolution(self):
         self.arguments += ['-vf', 'scale=trunc(oh*a/2)*2:trunc(ow/a/2)*2']
 
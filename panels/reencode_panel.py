@@ -1,13 +1,19 @@
 #!/usr/bin/env python
 
 import wx
+import logging
+import os
 import pathlib
+import queue
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Optional
 
 import modules.video as video
 from modules.video import VIDEO_EXTENSIONS, VIDEO_CODECS, AUDIO_CODECS
+from modules.video import VIDEO_EXT_LIST, VIDEO_CODEC_LIST, AUDIO_CODEC_LIST
+from modules.video import VIDEO_EXT_INDEX, VIDEO_CODEC_INDEX, AUDIO_CODEC_INDEX
 from modules.video import VideoProcessingError, FFmpegNotFoundError, VideoFileError
 from modules.presets import PresetError
 from modules.output import OutputPathGenerator
@@ -18,6 +24,48 @@ if TYPE_CHECKING:
 
 logger = get_logger('reencode_panel')
 
+# Subtitle choices in display order, and their positions in the choice control
+_SUB_LIST = ["None", "First", "All", "srt"]
+_SUB_INDEX = {sub: i for i, sub in enumerate(_SUB_LIST)}
+
+
+def _file_size(path):
+    """Return the size of a file in bytes, or 0 if it can't be read."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _choice_setter(choice, index_map):
+    """Return a function selecting a value in a choice control, ignoring unknown values."""
+    def set_choice(value):
+        index = index_map.get(value)
+        if index is not None:
+            choice.SetSelection(index)
+    return set_choice
+
+
+def _build_suffix(base, append_res=False, width=None, height=None, fix_resolution=False):
+    """Build the output filename suffix, e.g. "_copy_1920x1080".
+    
+    A leading underscore is added if missing. If the resolution is
+    requested but unknown, a "WxH" placeholder is used.
+    """
+    suffix = base
+    if append_res:
+        if width is None or height is None:
+            suffix = f"{suffix}_WxH"
+        else:
+            if fix_resolution:
+                width = (width // 2) * 2  # Use integer division
+                height = (height // 2) * 2
+            suffix = f"{suffix}_{int(width)}x{int(height)}"
+    
+    if suffix and not suffix.startswith("_"):
+        suffix = f"_{suffix}"
+    return suffix
+
 
 class ReencodePane(wx.CollapsiblePane):
     """Collapsible panel for video reencoding options and controls."""
@@ -25,26 +73,48 @@ class ReencodePane(wx.CollapsiblePane):
     def __init__(self, parent, app_state: "AppState"):
         self.app_state = app_state
         self.cancel_event = threading.Event()
-        self.current_encode_job = None
+        self.current_encode_jobs = {}  # job slot -> video.encode in progress
         self.current_file_name = ""
         self.encoding_start_time = 0
         
+        # Number of ffmpeg processes to run side by side during a batch
+        default_jobs = max(1, (os.cpu_count() or 1) // 4)
+        self.max_concurrent_jobs = max(1, int(self.app_state.config.get("max_concurrent_jobs", default_jobs)))
+        self.threads_per_worker = max(2, (os.cpu_count() or 1) // self.max_concurrent_jobs)
+        self._free_slots = queue.Queue()
+        self._last_progress_post = {}  # job slot -> time.monotonic() of last UI update
+        self._preview_generation = 0  # Bumped per preview request to discard stale results
+        self._last_preview_key = None  # Inputs of the preview currently shown
+        
         # Initialize output path generator with default settings
         self.output_generator = OutputPathGenerator()
         self.output_generator.set_naming_options(suffix="_encoded")
         
         super().__init__(parent, label="Reencode Options", style=wx.CP_DEFAULT_STYLE | wx.CP_NO_TLW_RESIZE)
 
+        # Timer for debounced preview updates
+        self._preview_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.OnPreviewTimer, self._preview_timer)
+
+        # Long-lived worker thread that runs queued reencode batches
+        self._job_queue = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+
+        # Widgets are created the first time the pane is expanded
+        self.ui_built = False
+        self.Bind(wx.EVT_COLLAPSIBLEPANE_CHANGED, self.OnExpand)
+
+    def _build_ui(self):
+        """Create the pane's controls. Called once, on first expansion."""
         panel = self.GetPane()
         re_vsizer = wx.BoxSizer(wx.VERTICAL)
         re_hsizer1 = wx.BoxSizer(wx.HORIZONTAL)
         re_hsizer2 = wx.BoxSizer(wx.HORIZONTAL)
-        self.Bind(wx.EVT_COLLAPSIBLEPANE_CHANGED, self.OnExpand)
 
         # Preset Management Section
         preset_sizer = wx.BoxSizer(wx.HORIZONTAL)
         preset_label = wx.StaticText(panel, label="Preset:")
-        self.preset_choice = wx.ComboBox(panel, style=wx.CB_READONLY)
+        self.preset_choice = wx.Choice(panel)
         self.load_preset_choices()
         
         self.save_preset_button = wx.Button(panel, label="Save Preset...")
@@ -58,26 +128,26 @@ class ReencodePane(wx.CollapsiblePane):
         preset_sizer.Add(self.save_preset_button, 0, wx.ALL, 5)
         preset_sizer.Add(self.manage_presets_button, 0, wx.ALL, 5)
         
-        self.preset_choice.Bind(wx.EVT_COMBOBOX, self.OnPresetSelected)
+        self.preset_choice.Bind(wx.EVT_CHOICE, self.OnPresetSelected)
 
         self.vcodec_checkbox = wx.CheckBox(panel, label="Video Codec:")
         self.vcodec_checkbox.SetValue(self.app_state.config.get("encode_video", False))
-        self.vcodec_choice = wx.ComboBox(panel, size = [-1, -1], choices=list(VIDEO_CODECS))
+        self.vcodec_choice = wx.Choice(panel, choices=VIDEO_CODEC_LIST)
         vcodec_default = self.app_state.config.get("video_codec", "libx265")
         if vcodec_default not in VIDEO_CODECS:
-            print(f"Warning: {vcodec_default} is not a valid video codec. Using default.")
+            logger.warning(f"{vcodec_default} is not a valid video codec. Using default.")
             vcodec_default = "libx265"
-        self.vcodec_choice.SetSelection(VIDEO_CODECS.index(vcodec_default))
+        self.vcodec_choice.SetSelection(VIDEO_CODEC_INDEX[vcodec_default])
 
         self.acodec_checkbox = wx.CheckBox(panel, label="Audio Codec:")
         self.acodec_checkbox.SetValue(self.app_state.config.get("encode_audio", False))
-        self.acodec_choice = wx.ComboBox(panel, size = [-1, -1], choices=list(AUDIO_CODECS))
+        self.acodec_choice = wx.Choice(panel, choices=AUDIO_CODEC_LIST)
         acodec_default = self.app_state.config.get("audio_codec", "aac")
 
         if acodec_default not in AUDIO_CODECS:
-            print(f"Warning: {acodec_default} is not a valid audio codec. Using default.")
+            logger.warning(f"{acodec_default} is not a valid audio codec. Using default.")
             acodec_default = "aac"
-        self.acodec_choice.SetSelection(AUDIO_CODECS.index(acodec_default))
+        self.acodec_choice.SetSelection(AUDIO_CODEC_INDEX[acodec_default])
 
         self.suffix_label = wx.StaticText(panel, label="Suffix:")
         self.suffix_textbox = wx.TextCtrl(panel)
@@ -87,18 +157,17 @@ class ReencodePane(wx.CollapsiblePane):
         self.append_res_checkbox.SetValue(self.app_state.config.get("append_res", False))
 
         self.extension_label = wx.StaticText(panel, label="Extension:")
-        self.extension_choice = wx.ComboBox(panel, size = [-1, -1], choices=list(VIDEO_EXTENSIONS))
+        self.extension_choice = wx.Choice(panel, choices=VIDEO_EXT_LIST)
         extension_default = self.app_state.config.get("output_extension", ".mkv")
 
         if extension_default not in VIDEO_EXTENSIONS:
-            print(f"Warning: {extension_default} is not a valid video extension. Using default.")
+            logger.warning(f"{extension_default} is not a valid video extension. Using default.")
             extension_default = ".mkv"
-        self.extension_choice.SetSelection(list(VIDEO_EXTENSIONS).index(extension_default))
+        self.extension_choice.SetSelection(VIDEO_EXT_INDEX[extension_default])
 
         self.sub_label = wx.StaticText(panel, label="Subtitles:")
-        sub_list = ["None", "First", "All", "srt"]
-        self.sub_choice = wx.ComboBox(panel, size = [-1, -1], choices=sub_list)
-        self.sub_choice.SetSelection(sub_list.index(self.app_state.config.get("subtitles", "First")))
+        self.sub_choice = wx.Choice(panel, choices=_SUB_LIST)
+        self.sub_choice.SetSelection(_SUB_INDEX.get(self.app_state.config.get("subtitles"), _SUB_INDEX["First"]))
         
         self.exclude_data_streams = wx.CheckBox(panel, label="No Data")
         self.exclude_data_streams.SetValue(self.app_state.config.get("no_data", False))
@@ -122,8 +191,12 @@ class ReencodePane(wx.CollapsiblePane):
         self.total_label = wx.StaticText(panel, label="Total Progress:")
         self.total_progress = wx.Gauge(panel, range=100, style=wx.GA_HORIZONTAL)
         
-        self.current_file_label = wx.StaticText(panel, label="→")
-        self.current_file_progress = wx.Gauge(panel, range=100, style=wx.GA_HORIZONTAL)
+        # One label/gauge pair per concurrent encode job
+        self.job_labels = []
+        self.job_gauges = []
+        for _ in range(self.max_concurrent_jobs):
+            self.job_labels.append(wx.StaticText(panel, label="→"))
+            self.job_gauges.append(wx.Gauge(panel, range=100, style=wx.GA_HORIZONTAL))
         
         self.time_estimate = wx.StaticText(panel, label="")
 
@@ -166,8 +239,9 @@ class ReencodePane(wx.CollapsiblePane):
         re_vsizer.Add(re_hsizer2, 0, wx.ALL | wx.EXPAND, 0)
         re_vsizer.Add(self.total_label, 0, wx.ALL, 5)
         re_vsizer.Add(self.total_progress, 0, wx.EXPAND | wx.ALL, 5)
-        re_vsizer.Add(self.current_file_label, 0, wx.ALL, 5)
-        re_vsizer.Add(self.current_file_progress, 0, wx.EXPAND | wx.ALL, 5)
+        for job_label, job_gauge in zip(self.job_labels, self.job_gauges):
+            re_vsizer.Add(job_label, 0, wx.ALL, 5)
+            re_vsizer.Add(job_gauge, 0, wx.EXPAND | wx.ALL, 5)
         re_vsizer.Add(self.time_estimate, 0, wx.ALL, 5)
 
         panel.SetSizer(re_vsizer)
@@ -178,30 +252,68 @@ class ReencodePane(wx.CollapsiblePane):
         # Bind events to update preview
         self.suffix_textbox.Bind(wx.EVT_TEXT, self.OnUpdatePreview)
         self.append_res_checkbox.Bind(wx.EVT_CHECKBOX, self.OnUpdatePreview)
-        self.extension_choice.Bind(wx.EVT_COMBOBOX, self.OnUpdatePreview)
+        self.extension_choice.Bind(wx.EVT_CHOICE, self.OnUpdatePreview)
         self.vcodec_checkbox.Bind(wx.EVT_CHECKBOX, self.OnUpdatePreview)
-        self.vcodec_choice.Bind(wx.EVT_COMBOBOX, self.OnUpdatePreview)
+        self.vcodec_choice.Bind(wx.EVT_CHOICE, self.OnUpdatePreview)
         self.crf_checkbox.Bind(wx.EVT_CHECKBOX, self.OnUpdatePreview)
         self.crf_int.Bind(wx.EVT_SPINCTRL, self.OnUpdatePreview)
         
+        # Preset key -> function applying that setting to its control
+        self._preset_setters = {
+            "encode_video": self.vcodec_checkbox.SetValue,
+            "video_codec": _choice_setter(self.vcodec_choice, VIDEO_CODEC_INDEX),
+            "encode_audio": self.acodec_checkbox.SetValue,
+            "audio_codec": _choice_setter(self.acodec_choice, AUDIO_CODEC_INDEX),
+            "use_crf": self.crf_checkbox.SetValue,
+            "crf_value": self.crf_int.SetValue,
+            "output_suffix": self.suffix_textbox.SetValue,
+            "append_res": self.append_res_checkbox.SetValue,
+            "output_extension": _choice_setter(self.extension_choice, VIDEO_EXT_INDEX),
+            "subtitles": _choice_setter(self.sub_choice, _SUB_INDEX),
+            "no_data": self.exclude_data_streams.SetValue,
+            "fix_resolution": self.fix_res.SetValue,
+            "fix_err": self.fix_errors.SetValue,
+        }
+        
+        self.ui_built = True
+        
         # Initial preview update
         self.update_output_preview()
 
     def OnUpdatePreview(self, event=None):
         """Handle control changes that should update the output preview."""
-        self.update_output_preview()
+        # Collapse bursts of changes (e.g. typing a suffix) into a single update
+        self.request_preview_update(150)
         if event:
             event.Skip()
 
+    def request_preview_update(self, delay_ms=50):
+        """Schedule an output preview update, restarting the wait if one is pending."""
+        self._preview_timer.StartOnce(delay_ms)
+
+    def OnPreviewTimer(self, event):
+        """Handle the timer event for debounced preview updates."""
+        self.update_output_preview()
+
     def update_output_preview(self):
-        """Update the output filename preview based on current settings."""
+        """Update the output filename preview based on current settings.
+        
+        Control values are read here on the GUI thread; the ffprobe call and
+        path generation run on a background thread.
+        """
+        if not self.ui_built:
+            return
+        
+        # Any result still in flight is now stale
+        self._preview_generation += 1
         try:
             # Get the first selected video file
             if not self.app_state.video_list:
+                self._last_preview_key = None
                 self.output_preview_label.SetLabel("Preview: (no file selected)")
                 return
                 
-            first_video = pathlib.Path(self.app_state.video_list[0])
+            first_video = str(self.app_state.video_list[0])
             
             # Sync main controls to output generator
             self.sync_main_controls_to_generator()
@@ -218,45 +330,72 @@ class ReencodePane(wx.CollapsiblePane):
                 "fix_resolution": self.fix_res.GetValue()
             }
             
+            # Skip regeneration if nothing that affects the preview has changed
+            gen = self.output_generator
+            key = (first_video, tuple(options.values()),
+                   gen.output_directory, gen.subdirectory_pattern, gen.filename_pattern,
+                   gen.include_codec, gen.include_quality, gen.include_date,
+                   gen.overwrite_policy, gen.preserve_directory_structure)
+            if key == self._last_preview_key:
+                return
+            
+            threading.Thread(target=self._preview_worker,
+                             args=(first_video, options, self._preview_generation, key),
+                             daemon=True).start()
+            
+        except Exception as e:
+            logger.warning(f"Error updating preview: {e}")
+            self.output_preview_label.SetLabel("Preview: (error)")
+
+    def _preview_worker(self, first_video, options, generation, key):
+        """Build the preview filename in the background and post it to the GUI."""
+        try:
             # Try to get video info for resolution
             try:
-                info = video.info(str(first_video))
+                info = video.cached_info(first_video)
                 output_path = self.output_generator.generate_output_path(first_video, info, options)
-                preview_name = pathlib.Path(output_path).name
+                preview_name = output_path.name
             except Exception as e:
                 # Fallback to simple preview if video info fails
-                print(f"Preview generation failed, using fallback: {e}")
-                suffix = options["output_suffix"]
-                
-                if options["append_res"]:
-                    # Use placeholder resolution for preview
-                    suffix = f"{suffix}_WxH"
-                    
-                if suffix and not suffix.startswith("_"):
-                    suffix = f"_{suffix}"
-                    
-                preview_name = f"{first_video.stem}{suffix}{options['output_extension']}"
+                logger.debug(f"Preview generation failed, using fallback: {e}")
+                # Resolution is unknown here, so a placeholder is used
+                suffix = _build_suffix(options["output_suffix"], options["append_res"])
+                stem = os.path.splitext(os.path.basename(first_video))[0]
+                preview_name = f"{stem}{suffix}{options['output_extension']}"
             
             # Truncate if too long
             if len(preview_name) > 50:
                 preview_name = preview_name[:47] + "..."
                 
-            self.output_preview_label.SetLabel(f"Preview: {preview_name}")
+            label = f"Preview: {preview_name}"
             
         except Exception as e:
-            print(f"Error updating preview: {e}")
-            self.output_preview_label.SetLabel("Preview: (error)")
+            logger.warning(f"Error updating preview: {e}")
+            label = "Preview: (error)"
+            key = None  # Retry on the next request
+        
+        wx.CallAfter(self._set_preview_label, label, generation, key)
+
+    def _set_preview_label(self, label, generation, key=None):
+        """Show a preview result unless a newer one has been requested since."""
+        if generation == self._preview_generation:
+            self.output_preview_label.SetLabel(label)
+            self._last_preview_key = key
 
     def update_status_bar(self, message):
         """Helper method to update the main frame's status bar."""
-        def update_status():
-            top_frame = wx.GetTopLevelParent(self)
-            if hasattr(top_frame, 'SetStatusText'):
-                top_frame.SetStatusText(message)
-        wx.CallAfter(update_status)
+        wx.CallAfter(self._set_status_text, message)
+
+    def _set_status_text(self, message):
+        """Set the main frame's status bar text (GUI thread only)."""
+        top_frame = wx.GetTopLevelParent(self)
+        if hasattr(top_frame, 'SetStatusText'):
+            top_frame.SetStatusText(message)
 
     def OnExpand(self, event):
         """Handle panel expansion/collapse."""
+        if not self.IsCollapsed() and not self.ui_built:
+            self._build_ui()
         self.Layout()
         self.Fit()
         parent = self.GetParent()
@@ -274,7 +413,8 @@ class ReencodePane(wx.CollapsiblePane):
         self.sync_main_controls_to_generator()
         
         # Reset progress displays
-        self.current_file_progress.SetValue(0)
+        for job_gauge in self.job_gauges:
+            job_gauge.SetValue(0)
         self.update_status_bar("Starting encoding...")
         self.time_estimate.SetLabel("")
         self.encoding_start_time = time.time()
@@ -294,19 +434,34 @@ class ReencodePane(wx.CollapsiblePane):
         options["use_crf"] = self.crf_checkbox.GetValue()
         options["crf_value"] = str(self.crf_int.GetValue())
 
-        # Start reencoding in a background thread
-        threading.Thread(target=self.ReEncodeWorker, args=(options,), daemon=True).start()
+        # Hand the batch to the background worker
+        self._job_queue.put(options)
 
     def OnCancel(self, event):
         """Cancel the current encoding operation."""
         if self.cancel_event:
             self.cancel_event.set()
+            # Drop any batches that have not started yet
+            while True:
+                try:
+                    self._job_queue.get_nowait()
+                except queue.Empty:
+                    break
             self.cancel_button.Disable()
             self.update_status_bar("Cancelling...")
 
-    def update_progress(self, progress_info):
-        """Update the current file progress display."""
-        wx.CallAfter(self.current_file_progress.SetValue, int(progress_info.percent))
+    def update_progress(self, progress_info, job_id=0):
+        """Update the progress display for the given job slot.
+        
+        Updates are throttled to about 10 per second per job and posted to
+        the GUI thread as a single call.
+        """
+        now = time.monotonic()
+        if now - self._last_progress_post.get(job_id, 0.0) < 0.1 and progress_info.percent < 100:
+            return
+        self._last_progress_post[job_id] = now
+        
+        percent = int(progress_info.percent)
         
         # Format progress details with ETA on the same line
         details = f"Frame: {progress_info.frame} | FPS: {progress_info.fps:.1f} | Speed: {progress_info.speed}"
@@ -317,213 +472,99 @@ class ReencodePane(wx.CollapsiblePane):
             eta_seconds = int(progress_info.eta_seconds % 60)
             details += f" | ETA: {eta_minutes:02d}:{eta_seconds:02d}"
         
-        # Get the main frame to update status bar
-        wx.CallAfter(self.update_status_bar, details)
+        # Tag the status line with the job when several encodes share it
+        if self.max_concurrent_jobs > 1:
+            details = f"Job {job_id + 1}: {details}"
         
-        # Clear the separate time estimate label since we're showing it inline
-        wx.CallAfter(self.time_estimate.SetLabel, "")
+        def apply():
+            self.job_gauges[job_id].SetValue(percent)
+            self._set_status_text(details)
+            # Clear the separate time estimate label since we're showing it inline
+            self.time_estimate.SetLabel("")
+        
+        wx.CallAfter(apply)
 
     def output_callback(self, line):
         """Handle FFmpeg output lines."""
         # This could be used for additional logging if needed
         pass
 
+    def _worker_loop(self):
+        """Run queued reencode batches one at a time for the lifetime of the pane."""
+        while True:
+            options = self._job_queue.get()
+            try:
+                self.ReEncodeWorker(options)
+            except Exception as e:
+                log_error_with_context(e, "Unexpected error in reencode batch", logger)
+                wx.CallAfter(self.reencode_button.Enable)
+                wx.CallAfter(self.cancel_button.Disable)
+
     def ReEncodeWorker(self, options):
         """Worker thread for reencoding with comprehensive error handling."""
         
-        # Check prerequisites first
+        # Check prerequisites first (only until the tools have been found once)
         try:
-            video.check_ffmpeg_availability()
+            if not self.app_state.ffmpeg_checked:
+                video.check_ffmpeg_availability()
+                self.app_state.ffmpeg_checked = True
         except FFmpegNotFoundError as e:
+            self.app_state.ffmpeg_checked = False
             wx.CallAfter(lambda: wx.MessageBox(f"Cannot start encoding:\n\n{e}", 
                                               "FFmpeg Not Found", wx.OK | wx.ICON_ERROR))
             wx.CallAfter(self.reencode_button.Enable)
             return
             
-        if not self.app_state.video_list:
+        # Snapshot the selection; the list is updated on the GUI thread as files finish
+        videos = tuple(self.app_state.video_list)
+        total_files = len(videos)
+        
+        # With several jobs, start the largest files first so the batch doesn't end on one long encode
+        if self.max_concurrent_jobs > 1:
+            videos = tuple(sorted(videos, key=_file_size, reverse=True))
+        
+        if not videos:
             wx.CallAfter(lambda: wx.MessageBox("No videos selected for encoding.", 
                                               "No Selection", wx.OK | wx.ICON_INFORMATION))
             wx.CallAfter(self.reencode_button.Enable)
             return
 
         wx.CallAfter(self.total_progress.SetValue, 0)
-        wx.CallAfter(self.total_progress.SetRange, len(self.app_state.video_list))
+        wx.CallAfter(self.total_progress.SetRange, total_files)
         
         progress = 0
         successful = 0
         errors = []
         
-        for video_file in self.app_state.video_list:
-            if not video_file:
-                continue
-                
-            # Check for cancellation
-            if self.cancel_event.is_set():
-                self.update_status_bar("Cancelled by user")
-                break
-                
-            video_name = pathlib.Path(video_file).name
-            logger.info(f"Starting encoding for: {video_file}")
+        # Each running job borrows a slot so it has its own label and gauge
+        self._free_slots = queue.Queue()
+        for slot in range(self.max_concurrent_jobs):
+            self._free_slots.put(slot)
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_jobs) as executor:
+            futures = [executor.submit(self._encode_one, video_file, options)
+                       for video_file in videos if video_file]
             
-            try:
-                info = video.info(video_file)
-                output_suffix = options["output_suffix"]
-
-                if options["append_res"]:
-                    res_width = info.max_width
-                    res_height = info.max_height
-                    if options["fix_resolution"]:
-                        res_width = (res_width // 2) * 2  # Use integer division
-                        res_height = (res_height // 2) * 2
-                    output_suffix = f"{output_suffix}_{int(res_width)}x{int(res_height)}"
-
-                if output_suffix and not output_suffix.startswith("_"):
-                    output_suffix = f"_{output_suffix}"
-                    
-                encode_job = video.encode()
-                encode_job.add_input(video_file)
-                
-                # Use advanced output path generator instead of simple suffix
-                try:
-                    video_info_obj = info
-                    output_path = self.output_generator.generate_output_path(
-                        pathlib.Path(video_file), video_info_obj, options)
-                    encode_job.add_output(str(output_path))
-                except Exception as e:
-                    # Fallback to original method if output generator fails
-                    logger.warning(f"Output generator failed, using fallback: {e}")
-                    encode_job.add_output_from_input(file_append=output_suffix, file_extension=options["output_extension"])
-
-                # Get the output filename for display
-                output_name = pathlib.Path(encode_job.output).name
-                
-                # Update current file label with both input and output filenames
-                wx.CallAfter(self.current_file_label.SetLabel, f"{video_name} → {output_name}")
-                wx.CallAfter(self.current_file_progress.SetValue, 0)
-
-                # Check if output file already exists and handle according to policy
-                if pathlib.Path(encode_job.output).exists():
-                    if self.output_generator.overwrite_policy == "skip":
-                        logger.info(f"Output file '{encode_job.output}' already exists. Skipping.")
-                        errors.append(f"{video_name}: Output file already exists")
-                        progress += 1
-                        wx.CallAfter(self.total_progress.SetValue, progress)
-                        continue
-                    elif self.output_generator.overwrite_policy == "overwrite":
-                        logger.info(f"Output file '{encode_job.output}' already exists. Will overwrite.")
-                    # increment policy is handled by the output generator itself
-
-                # Configure encoding options
-                if options["encode_video"]:
-                    encode_job.set_video_codec(options["video_codec"])
-                if options["encode_audio"]:
-                    encode_job.set_audio_codec(options["audio_codec"])
-                if options["subtitles"] == "None":
-                    encode_job.exclude_subtitles()
-                elif options["subtitles"] == "All":
-                    encode_job.copy_subtitles()
-                elif options["subtitles"] == "srt":
-                    logger.debug("Adding srt file")
-                    srt_file = pathlib.Path(video_file).with_suffix(".srt")
-                    logger.debug(f"Looking for srt file: {srt_file}")
-                    if srt_file.exists():
-                        logger.info(f"Adding srt file: {srt_file}")
-                        encode_job.add_input(str(srt_file))
-                    else:
-                        logger.warning(f"SRT file {srt_file} does not exist. Skipping.")
-                        
-                if options["no_data"]:
-                    encode_job.exclude_data()
-                if options["fix_resolution"]:
-                    encode_job.fix_resolution()
-                if options["fix_err"]:
-                    encode_job.fix_errors()
-                if options["use_crf"]:
-                    encode_job.set_crf(options["crf_value"])
-
-                # Set up progress tracking
-                encode_job.set_progress_callback(self.update_progress)
-                encode_job.set_cancel_event(self.cancel_event)
-                self.current_encode_job = encode_job
-
-                # Calculate duration for this specific file
-                if hasattr(info, 'runtime') and info.runtime:
-                    try:
-                        # Parse runtime format like "00:01:23.45" 
-                        time_parts = info.runtime.split(':')
-                        if len(time_parts) >= 3:
-                            hours = int(time_parts[0])
-                            minutes = int(time_parts[1])
-                            seconds = float(time_parts[2])
-                            duration_ms = (hours * 3600 + minutes * 60 + seconds) * 1000
-                            encode_job.total_duration_ms = duration_ms
-                    except (ValueError, IndexError):
-                        pass
-
-                # Define output callback to print to console
-                def console_output_callback(line):
-                    logger.debug(f"FFmpeg output: {line}")
-
-                # Perform the encoding
-                encode_result = encode_job.reencode(output_callback=console_output_callback)
-                
-                if encode_result and not self.cancel_event.is_set():
+            for future in as_completed(futures):
+                ok, error = future.result()
+                if ok:
                     successful += 1
-                    
-                    # Capture the completed video file path before any async operations
-                    completed_video_file = video_file
-                    
-                    # After successful encoding, refresh the video list and recheck remaining videos
-                    if self.app_state.main_frame and hasattr(self.app_state.main_frame, "listbox"):
-                        def refresh_and_recheck():
-                            # First uncheck the completed video to update the video list
-                            logger.debug(f"Unchecking completed video: {pathlib.Path(completed_video_file).name}")
-                            self.app_state.main_frame.listbox.uncheck_video_by_path(completed_video_file)
-                            
-                            # Get the updated list of selected videos (should exclude the just-processed one)
-                            remaining_videos = list(self.app_state.video_list)  # Make a copy
-                            logger.debug(f"Current video_list after unchecking: {[pathlib.Path(v).name for v in remaining_videos]}")
-                            logger.debug(f"Preserving selection for {len(remaining_videos)} remaining videos: {[pathlib.Path(v).name for v in remaining_videos]}")
-                            
-                            # Refresh the list to show the new encoded file
-                            def on_refresh_complete():
-                                logger.debug(f"Refresh completed, re-checking {len(remaining_videos)} videos")
-                                self.app_state.main_frame.listbox.recheck_videos_by_paths(remaining_videos)
-                            
-                            self.app_state.main_frame.listbox.refresh(completion_callback=on_refresh_complete)
-                        
-                        wx.CallAfter(refresh_and_recheck)
-                        
-                elif self.cancel_event.is_set():
-                    errors.append(f"{video_name}: Cancelled by user")
-                    break
+                elif error:
+                    errors.append(error)
                 
-            except (VideoProcessingError, FFmpegNotFoundError, VideoFileError) as e:
-                error_msg = f"{video_name}: {e}"
-                errors.append(error_msg)
-                log_error_with_context(e, f"Processing video {video_name}", logger)
-                
-            except Exception as e:
-                error_msg = f"{video_name}: Unexpected error - {e}"
-                errors.append(error_msg)
-                log_error_with_context(e, f"Unexpected error processing {video_name}", logger)
-            
-            finally:
                 progress += 1
                 wx.CallAfter(self.total_progress.SetValue, progress)
-                wx.CallAfter(self.current_file_progress.SetValue, 0)
-                self.current_encode_job = None
 
         # Show completion summary
-        total_files = len(self.app_state.video_list)
         failed = len(errors)
         cancelled = self.cancel_event.is_set()
         
         # Reset UI state
         wx.CallAfter(self.reencode_button.Enable)
         wx.CallAfter(self.cancel_button.Disable)
-        wx.CallAfter(self.current_file_label.SetLabel, "→")
-        wx.CallAfter(self.current_file_progress.SetValue, 0)
+        for job_label, job_gauge in zip(self.job_labels, self.job_gauges):
+            wx.CallAfter(job_label.SetLabel, "→")
+            wx.CallAfter(job_gauge.SetValue, 0)
         
         if cancelled:
             self.update_status_bar("Encoding cancelled")
@@ -534,10 +575,10 @@ class ReencodePane(wx.CollapsiblePane):
             self.update_status_bar("Encoding completed with errors")
             wx.CallAfter(self.time_estimate.SetLabel, "")
             
-            if failed <= 5:
-                error_details = "\n".join(errors)
-            else:
-                error_details = "\n".join(errors[:5]) + f"\n... and {failed - 5} more errors"
+            # Only the errors that are shown get formatted
+            error_details = "\n".join(f"{name}: {reason}" for name, reason in errors[:5])
+            if failed > 5:
+                error_details += f"\n... and {failed - 5} more errors"
                 
             summary = f"Encoding completed:\n\n✓ {successful} successful\n✗ {failed} failed\n\nErrors:\n{error_details}"
             wx.CallAfter(lambda: wx.MessageBox(summary, "Encoding Complete", wx.OK | wx.ICON_WARNING))
@@ -550,6 +591,154 @@ class ReencodePane(wx.CollapsiblePane):
         if self.app_state.main_frame and hasattr(self.app_state.main_frame, "listbox"):
             wx.CallAfter(self.app_state.main_frame.listbox.refresh)
 
+    def _encode_one(self, video_file, options):
+        """Encode a single file on a pool thread.
+        
+        Returns:
+            tuple: (ok, error) where error is a (file name, reason) tuple, or None when
+            the file succeeded or was never started because of cancellation.
+        """
+        # Files still queued when the user cancels are dropped without an error
+        if self.cancel_event.is_set():
+            return False, None
+        
+        slot = self._free_slots.get()
+        job_label = self.job_labels[slot]
+        job_gauge = self.job_gauges[slot]
+        video_name = os.path.basename(video_file)
+        logger.info(f"Starting encoding for: {video_file}")
+        
+        try:
+            info = video.cached_info(video_file)
+            output_suffix = _build_suffix(options["output_suffix"], options["append_res"],
+                                          info.max_width, info.max_height, options["fix_resolution"])
+                
+            encode_job = video.encode()
+            encode_job.add_input(video_file, file_info=info)
+            
+            # Use advanced output path generator instead of simple suffix
+            try:
+                video_info_obj = info
+                output_path = self.output_generator.generate_output_path(
+                    video_file, video_info_obj, options)
+                encode_job.add_output(str(output_path))
+            except Exception as e:
+                # Fallback to original method if output generator fails
+                logger.warning(f"Output generator failed, using fallback: {e}")
+                encode_job.add_output_from_input(file_append=output_suffix, file_extension=options["output_extension"])
+
+            # Get the output filename for display
+            output_name = os.path.basename(encode_job.output)
+            
+            # Update this job's label with both input and output filenames
+            wx.CallAfter(job_label.SetLabel, f"{video_name} → {output_name}")
+            wx.CallAfter(job_gauge.SetValue, 0)
+
+            # Only the skip policy needs to know whether the output already exists;
+            # overwrite replaces it and increment is handled by the output generator
+            if self.output_generator.overwrite_policy == "skip" and os.path.exists(encode_job.output):
+                logger.info(f"Output file '{encode_job.output}' already exists. Skipping.")
+                return False, (video_name, "Output file already exists")
+
+            # Configure encoding options
+            if options["encode_video"]:
+                encode_job.set_video_codec(options["video_codec"])
+            if options["encode_audio"]:
+                encode_job.set_audio_codec(options["audio_codec"])
+            if options["subtitles"] == "None":
+                encode_job.exclude_subtitles()
+            elif options["subtitles"] == "All":
+                encode_job.copy_subtitles()
+            elif options["subtitles"] == "srt":
+                logger.debug("Adding srt file")
+                srt_file = os.path.splitext(video_file)[0] + ".srt"
+                logger.debug(f"Looking for srt file: {srt_file}")
+                if os.path.exists(srt_file):
+                    logger.info(f"Adding srt file: {srt_file}")
+                    encode_job.add_input(srt_file)
+                else:
+                    logger.warning(f"SRT file {srt_file} does not exist. Skipping.")
+                    
+            if options["no_data"]:
+                encode_job.exclude_data()
+            if options["fix_resolution"]:
+                encode_job.fix_resolution()
+            if options["fix_err"]:
+                encode_job.fix_errors()
+            if options["use_crf"]:
+                encode_job.set_crf(options["crf_value"])
+            
+            # Share the cores between concurrent jobs instead of oversubscribing
+            if self.max_concurrent_jobs > 1:
+                encode_job.set_threads(self.threads_per_worker)
+
+            # Set up progress tracking
+            encode_job.set_progress_callback(lambda p, job_id=slot: self.update_progress(p, job_id))
+            encode_job.set_cancel_event(self.cancel_event)
+            self.current_encode_jobs[slot] = encode_job
+
+            # Duration for this specific file drives the percentage and ETA
+            if info.total_duration_ms > 0:
+                encode_job.total_duration_ms = info.total_duration_ms
+            else:
+                logger.warning(f"No duration reported for {video_name}; progress and ETA will be unavailable")
+
+            # Only echo FFmpeg output when debug logging is on; the callback runs for every line
+            console_output_callback = None
+            if logger.isEnabledFor(logging.DEBUG):
+                def console_output_callback(line):
+                    logger.debug("FFmpeg output: %s", line)
+
+            # Perform the encoding
+            encode_result = encode_job.reencode(output_callback=console_output_callback)
+            
+            if encode_result and not self.cancel_event.is_set():
+                # Capture the completed video file path before any async operations
+                completed_video_file = video_file
+                
+                # After successful encoding, refresh the video list and recheck remaining videos
+                if self.app_state.main_frame and hasattr(self.app_state.main_frame, "listbox"):
+                    def refresh_and_recheck():
+                        # First uncheck the completed video to update the video list
+                        logger.debug(f"Unchecking completed video: {video_name}")
+                        video.forget_cached_info(completed_video_file)
+                        self.app_state.main_frame.listbox.uncheck_video_by_path(completed_video_file)
+                        
+                        # Get the updated list of selected videos (should exclude the just-processed one)
+                        remaining_videos = list(self.app_state.video_list)  # Make a copy
+                        logger.debug(f"Current video_list after unchecking: {[pathlib.Path(v).name for v in remaining_videos]}")
+                        logger.debug(f"Preserving selection for {len(remaining_videos)} remaining videos: {[pathlib.Path(v).name for v in remaining_videos]}")
+                        
+                        # Refresh the list to show the new encoded file
+                        def on_refresh_complete():
+                            logger.debug(f"Refresh completed, re-checking {len(remaining_videos)} videos")
+                            self.app_state.main_frame.listbox.recheck_videos_by_paths(remaining_videos)
+                        
+                        self.app_state.main_frame.listbox.refresh(completion_callback=on_refresh_complete)
+                    
+                    wx.CallAfter(refresh_and_recheck)
+                return True, None
+                    
+            if self.cancel_event.is_set():
+                return False, (video_name, "Cancelled by user")
+            return False, None
+            
+        except (VideoProcessingError, FFmpegNotFoundError, VideoFileError) as e:
+            if isinstance(e, FFmpegNotFoundError):
+                # Tools went missing; check again before the next batch
+                self.app_state.ffmpeg_checked = False
+            log_error_with_context(e, f"Processing video {video_name}", logger)
+            return False, (video_name, str(e))
+            
+        except Exception as e:
+            log_error_with_context(e, f"Unexpected error processing {video_name}", logger)
+            return False, (video_name, f"Unexpected error - {e}")
+        
+        finally:
+            wx.CallAfter(job_gauge.SetValue, 0)
+            self.current_encode_jobs.pop(slot, None)
+            self._free_slots.put(slot)
+
     def load_preset_choices(self):
         """Load available presets into the choice control."""
         if self.app_state.preset_manager:
@@ -574,62 +763,29 @@ class ReencodePane(wx.CollapsiblePane):
 
     def apply_preset_settings(self, preset):
         """Apply preset settings to the interface."""
-        # Video codec settings
-        if "encode_video" in preset:
-            self.vcodec_checkbox.SetValue(preset["encode_video"])
-        if "video_codec" in preset and preset["video_codec"] in VIDEO_CODECS:
-            self.vcodec_choice.SetSelection(VIDEO_CODECS.index(preset["video_codec"]))
-        
-        # Audio codec settings
-        if "encode_audio" in preset:
-            self.acodec_checkbox.SetValue(preset["encode_audio"])
-        if "audio_codec" in preset and preset["audio_codec"] in AUDIO_CODECS:
-            self.acodec_choice.SetSelection(AUDIO_CODECS.index(preset["audio_codec"]))
-        
-        # CRF settings
-        if "use_crf" in preset:
-            self.crf_checkbox.SetValue(preset["use_crf"])
-        if "crf_value" in preset:
-            self.crf_int.SetValue(preset["crf_value"])
-        
-        # Output settings
-        if "output_suffix" in preset:
-            self.suffix_textbox.SetValue(preset["output_suffix"])
-        if "append_res" in preset:
-            self.append_res_checkbox.SetValue(preset["append_res"])
-        if "output_extension" in preset and preset["output_extension"] in VIDEO_EXTENSIONS:
-            self.extension_choice.SetSelection(list(VIDEO_EXTENSIONS).index(preset["output_extension"]))
-        
-        # Subtitle settings
-        sub_list = ["None", "First", "All", "srt"]
-        if "subtitles" in preset and preset["subtitles"] in sub_list:
-            self.sub_choice.SetSelection(sub_list.index(preset["subtitles"]))
-        
-        # Other settings
-        if "no_data" in preset:
-            self.exclude_data_streams.SetValue(preset["no_data"])
-        if "fix_resolution" in preset:
-            self.fix_res.SetValue(preset["fix_resolution"])
-        if "fix_err" in preset:
-            self.fix_errors.SetValue(preset["fix_err"])
+        # Unknown keys and values not in a choice's index map are ignored
+        setters = self._preset_setters
+        for key, value in preset.items():
+            setter = setters.get(key)
+            if setter:
+                setter(value)
             
         # Update preview after applying preset
-        self.update_output_preview()
+        self.request_preview_update()
 
     def get_current_settings(self):
         """Get current settings from the interface."""
-        sub_list = ["None", "First", "All", "srt"]
         return {
             "encode_video": self.vcodec_checkbox.GetValue(),
-            "video_codec": list(VIDEO_CODECS)[self.vcodec_choice.GetSelection()],
+            "video_codec": VIDEO_CODECS[self.vcodec_choice.GetSelection()],
             "encode_audio": self.acodec_checkbox.GetValue(),
-            "audio_codec": list(AUDIO_CODECS)[self.acodec_choice.GetSelection()],
+            "audio_codec": AUDIO_CODECS[self.acodec_choice.GetSelection()],
             "use_crf": self.crf_checkbox.GetValue(),
             "crf_value": self.crf_int.GetValue(),
             "output_suffix": self.suffix_textbox.GetValue(),
             "append_res": self.append_res_checkbox.GetValue(),
-            "output_extension": list(VIDEO_EXTENSIONS)[self.extension_choice.GetSelection()],
-            "subtitles": sub_list[self.sub_choice.GetSelection()],
+            "output_extension": VIDEO_EXTENSIONS[self.extension_choice.GetSelection()],
+            "subtitles": _SUB_LIST[self.sub_choice.GetSelection()],
             "no_data": self.exclude_data_streams.GetValue(),
             "fix_resolution": self.fix_res.GetValue(),
             "fix_err": self.fix_errors.GetValue()
@@ -673,10 +829,8 @@ class ReencodePane(wx.CollapsiblePane):
         
         dlg = OutputOptionsDialog(self, self.output_generator)
         if dlg.ShowModal() == wx.ID_OK:
-            # Optionally sync back to main screen controls
+            # Sync back to main screen controls, which also schedules a preview update
             self.sync_generator_to_main_controls()
-            # Update preview after output options change
-            self.update_output_preview()
         dlg.Destroy()
     
     def sync_main_controls_to_generator(self):
@@ -706,43 +860,47 @@ class ReencodePane(wx.CollapsiblePane):
         
         # Find and select the extension in the choice control
         extension = self.output_generator.extension
-        extension_index = self.extension_choice.FindString(extension)
-        if extension_index != wx.NOT_FOUND:
+        extension_index = VIDEO_EXT_INDEX.get(extension)
+        if extension_index is not None:
             self.extension_choice.SetSelection(extension_index)
         else:
-            # If exact match not found, try to set the value directly
-            self.extension_choice.SetValue(extension)
+            logger.warning(f"Output extension '{extension}' is not in the extension list, keeping current selection")
             
         self.append_res_checkbox.SetValue(self.output_generator.include_resolution)
         
-        # Update the config to keep main screen and generator in sync
-        self.app_state.config["output_suffix"] = self.output_generator.suffix
-        self.app_state.config["output_extension"] = self.output_generator.extension
-        self.app_state.config["append_res"] = self.output_generator.include_resolution  # Use correct config key
-        
-        # Save all advanced output settings to config
-        self.save_advanced_output_settings()
+        # Update the config to keep main screen and generator in sync, along with
+        # all the advanced output settings, in one update
+        gen = self.output_generator
+        self.app_state.config.update(
+            output_suffix=gen.suffix,
+            output_extension=gen.extension,
+            append_res=gen.include_resolution,
+            **self._advanced_output_config()
+        )
         
         # Update preview after syncing
-        self.update_output_preview()
+        self.request_preview_update()
+    
+    def _advanced_output_config(self):
+        """Return the advanced output settings as config entries."""
+        gen = self.output_generator
+        return {
+            # Directory settings
+            "output_directory": gen.output_directory_str,
+            "subdirectory_pattern": gen.subdirectory_pattern,
+            # Naming settings
+            "filename_pattern": gen.filename_pattern,
+            "include_codec": gen.include_codec,
+            "include_quality": gen.include_quality,
+            "include_date": gen.include_date,
+            # File handling
+            "overwrite_policy": gen.overwrite_policy,
+            "preserve_directory_structure": gen.preserve_directory_structure,
+        }
     
     def save_advanced_output_settings(self):
         """Save all advanced output settings to app config."""
-        config = self.app_state.config
-        
-        # Directory settings
-        config["output_directory"] = str(self.output_generator.output_directory) if self.output_generator.output_directory else ""
-        config["subdirectory_pattern"] = self.output_generator.subdirectory_pattern
-        
-        # Naming settings
-        config["filename_pattern"] = self.output_generator.filename_pattern
-        config["include_codec"] = self.output_generator.include_codec
-        config["include_quality"] = self.output_generator.include_quality
-        config["include_date"] = self.output_generator.include_date
-        
-        # File handling
-        config["overwrite_policy"] = self.output_generator.overwrite_policy
-        config["preserve_directory_structure"] = self.output_generator.preserve_directory_structure
+        self.app_state.config.update(self._advanced_output_config())
     
     def load_advanced_output_settings(self):
         """Load all advanced output settings from app config."""
@@ -750,10 +908,8 @@ class ReencodePane(wx.CollapsiblePane):
         
         # Directory settings
         output_dir = config.get("output_directory", "")
-        if output_dir:
-            self.output_generator.set_output_directory(pathlib.Path(output_dir))
-        else:
-            self.output_generator.set_output_directory(None)
+        if output_dir != self.output_generator.output_directory_str:
+            self.output_generator.set_output_directory(output_dir or None)
             
         self.output_generator.set_subdirectory_pattern(config.get("subdirectory_pattern", ""))
         
@@ -775,4 +931,4 @@ class ReencodePane(wx.CollapsiblePane):
         self.output_generator.preserve_directory_structure = config.get("preserve_directory_structure", True)
         
         # Update preview after loading settings
-        self.update_output_preview()
+        self.request_preview_update()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 
 import wx
-import pathlib
+import os
 from typing import TYPE_CHECKING
 
 import modules.video as video
@@ -14,6 +14,14 @@ if TYPE_CHECKING:
 
 logger = get_logger('settings_panel')
 
+# Log level names offered in the settings, in display order
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR
+}
+
 
 class SettingsPanel(wx.Panel):
     """Panel for application settings configuration."""
@@ -22,6 +30,8 @@ class SettingsPanel(wx.Panel):
         self.app_state = app_state
         super().__init__(parent)
         sizer = wx.BoxSizer(wx.VERTICAL)
+        # Browse button id -> the path textbox it fills in
+        self._browse_targets = {}
 
         # ffmpeg
         ffmpeg_box = wx.BoxSizer(wx.HORIZONTAL)
@@ -29,7 +39,8 @@ class SettingsPanel(wx.Panel):
         self.ffmpeg_path = wx.TextCtrl(self)
         self.ffmpeg_path.SetValue(self.app_state.config.get("ffmpeg_bin", ""))
         ffmpeg_browse = wx.Button(self, label="Browse")
-        ffmpeg_browse.Bind(wx.EVT_BUTTON, lambda evt: self.on_browse(evt, self.ffmpeg_path))
+        self._browse_targets[ffmpeg_browse.GetId()] = self.ffmpeg_path
+        ffmpeg_browse.Bind(wx.EVT_BUTTON, self.on_browse)
         ffmpeg_box.Add(ffmpeg_label, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
         ffmpeg_box.Add(self.ffmpeg_path, 1, wx.ALL | wx.EXPAND, 5)
         ffmpeg_box.Add(ffmpeg_browse, 0, wx.ALL, 5)
@@ -40,7 +51,8 @@ class SettingsPanel(wx.Panel):
         self.ffprobe_path = wx.TextCtrl(self)
         self.ffprobe_path.SetValue(self.app_state.config.get("ffprobe_bin", ""))
         ffprobe_browse = wx.Button(self, label="Browse")
-        ffprobe_browse.Bind(wx.EVT_BUTTON, lambda evt: self.on_browse(evt, self.ffprobe_path))
+        self._browse_targets[ffprobe_browse.GetId()] = self.ffprobe_path
+        ffprobe_browse.Bind(wx.EVT_BUTTON, self.on_browse)
         ffprobe_box.Add(ffprobe_label, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
         ffprobe_box.Add(self.ffprobe_path, 1, wx.ALL | wx.EXPAND, 5)
         ffprobe_box.Add(ffprobe_browse, 0, wx.ALL, 5)
@@ -51,7 +63,8 @@ class SettingsPanel(wx.Panel):
         self.ffplay_path = wx.TextCtrl(self)
         self.ffplay_path.SetValue(self.app_state.config.get("ffplay_bin", ""))
         ffplay_browse = wx.Button(self, label="Browse")
-        ffplay_browse.Bind(wx.EVT_BUTTON, lambda evt: self.on_browse(evt, self.ffplay_path))
+        self._browse_targets[ffplay_browse.GetId()] = self.ffplay_path
+        ffplay_browse.Bind(wx.EVT_BUTTON, self.on_browse)
         ffplay_box.Add(ffplay_label, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
         ffplay_box.Add(self.ffplay_path, 1, wx.ALL | wx.EXPAND, 5)
         ffplay_box.Add(ffplay_browse, 0, wx.ALL, 5)
@@ -69,9 +82,9 @@ class SettingsPanel(wx.Panel):
         # Log level setting
         log_level_box = wx.BoxSizer(wx.HORIZONTAL)
         log_level_label = wx.StaticText(self, label="Log level:")
-        self.log_level_choice = wx.ComboBox(self, choices=["DEBUG", "INFO", "WARNING", "ERROR"], style=wx.CB_READONLY)
+        self.log_level_choice = wx.ComboBox(self, choices=list(_LEVEL_MAP), style=wx.CB_READONLY)
         current_log_level = self.app_state.config.get("log_level", "INFO")
-        if current_log_level in ["DEBUG", "INFO", "WARNING", "ERROR"]:
+        if current_log_level in _LEVEL_MAP:
             self.log_level_choice.SetValue(current_log_level)
         else:
             self.log_level_choice.SetValue("INFO")
@@ -95,8 +108,9 @@ class SettingsPanel(wx.Panel):
         sizer.Add(save_btn, 0, wx.ALL | wx.ALIGN_RIGHT, 10)
         self.SetSizer(sizer)
 
-    def on_browse(self, event, textbox):
+    def on_browse(self, event):
         """Browse for binary file."""
+        textbox = self._browse_targets[event.GetId()]
         dlg = wx.FileDialog(self, "Choose binary", wildcard="*", style=wx.FD_OPEN)
         if dlg.ShowModal() == wx.ID_OK:
             textbox.SetValue(dlg.GetPath())
@@ -113,7 +127,7 @@ class SettingsPanel(wx.Panel):
         # Validate paths if provided
         invalid_paths = []
         for name, path in [("ffmpeg", ffmpeg_path), ("ffprobe", ffprobe_path), ("ffplay", ffplay_path)]:
-            if path and not pathlib.Path(path).exists():
+            if path and not os.path.exists(path):
                 invalid_paths.append(f"{name}: {path}")
         
         if invalid_paths:
@@ -135,22 +149,19 @@ class SettingsPanel(wx.Panel):
         video.ffplay_bin = ffplay_path or "ffplay"
         
         # Update log level immediately
-        level_map = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR
-        }
-        if log_level in level_map:
-            set_log_level(level_map[log_level])
+        level = _LEVEL_MAP.get(log_level)
+        if level is not None:
+            set_log_level(level)
             logger.info(f"Log level changed to {log_level}")
         
         # Save the config to disk
         self.app_state.save_config()
         
         # Test FFmpeg availability with new settings
+        self.app_state.ffmpeg_checked = False
         try:
             video.check_ffmpeg_availability()
+            self.app_state.ffmpeg_checked = True
             wx.MessageBox("Settings saved and FFmpeg tools verified successfully!", 
                          "Settings Saved", wx.OK | wx.ICON_INFORMATION)
         except FFmpegNotFoundError as e:
@@ -18,22 +18,42 @@ class VideoInfoCollapsiblePanel(wx.CollapsiblePane):
         self.app_state = app_state
         self.Bind(wx.EVT_COLLAPSIBLEPANE_CHANGED, self.OnExpand)
         
-        # Get the pane and set up the video info panel
+        # The info panel is built on first expansion; until then the latest info is held here
+        self.vid_info_panel = None
+        self._pending_info = None
+        
+        # Start collapsed
+        self.Collapse(True)
+    
+    def _build_info_panel(self):
+        """Create the video info panel inside the pane, if not already done."""
+        if self.vid_info_panel:
+            return
         pane = self.GetPane()
         
         # Create the video info panel inside this collapsible pane
-        self.vid_info_panel = VideoInfoPanel(pane, app_state)
+        self.vid_info_panel = VideoInfoPanel(pane, self.app_state)
         
         # Set up the sizer
         pane_sizer = wx.BoxSizer(wx.VERTICAL)
         pane_sizer.Add(self.vid_info_panel, 1, wx.EXPAND | wx.ALL, 5)
         pane.SetSizer(pane_sizer)
         
-        # Start collapsed
-        self.Collapse(True)
+        if self._pending_info is not None:
+            self.vid_info_panel.update_info(self._pending_info)
+            self._pending_info = None
+    
+    def Expand(self):
+        """Expand the pane, building its contents first if needed."""
+        # Programmatic expansion doesn't send EVT_COLLAPSIBLEPANE_CHANGED
+        self._build_info_panel()
+        super().Expand()
     
     def OnExpand(self, event):
         """Handle expansion/collapse events."""
+        if not self.IsCollapsed():
+            self._build_info_panel()
+            self.GetPane().Layout()
         # Force layout update
         self.GetParent().Layout()
     
@@ -41,25 +61,30 @@ class VideoInfoCollapsiblePanel(wx.CollapsiblePane):
         """Update the video information display."""
         if self.vid_info_panel:
             self.vid_info_panel.update_info(info)
-            # Auto-expand when showing new info only if setting is enabled
-            auto_expand = self.app_state.config.get("auto_expand_video_info", False)
-            if auto_expand and self.IsCollapsed():
-                self.Expand()
-                # Force layout refresh after expansion
-                wx.CallAfter(self._refresh_layout)
+        else:
+            self._pending_info = info
+        # Auto-expand when showing new info only if setting is enabled
+        auto_expand = self.app_state.config.get("auto_expand_video_info", False)
+        if auto_expand and self.IsCollapsed():
+            self.Expand()
+            # Force layout refresh after expansion
+            wx.CallAfter(self._refresh_layout)
     
     def _refresh_layout(self):
         """Force a complete layout refresh."""
-        # Refresh multiple levels to ensure proper display
-        self.GetPane().Layout()
-        self.Layout()
+        # The parent's sizer owns this pane, so laying it out re-sizes the pane and
+        # its contents; the ancestors above it keep their size. Freeze the frame so
+        # the intermediate steps aren't painted.
         parent = self.GetParent()
-        if parent:
+        if not parent:
+            self.Layout()
+            return
+        top = wx.GetTopLevelParent(self)
+        top.Freeze()
+        try:
             parent.Layout()
-            # Also refresh the main frame if needed
-            grandparent = parent.GetParent()
-            if grandparent:
-                grandparent.Layout()
+        finally:
+            top.Thaw()
     
     def show_video_info(self, info_obj):
         """Show video information and auto-expand."""
@@ -8,26 +8,52 @@ if TYPE_CHECKING:
     from app_state import AppState
 
 
+_STREAM_KEYS = ("video_streams", "audio_streams", "subtitle_streams", "data_streams")
+
+
+_SIZE_UNITS = (("KB", 1024), ("MB", 1024 ** 2), ("GB", 1024 ** 3))
+
+
+def _format_size(info):
+    """Return the file size as KB, MB or GB, whichever fits."""
+    size = info.size
+    # Each unit covers 10 bits of the byte count, so the bit length picks the unit
+    unit, divisor = _SIZE_UNITS[min(2, max(0, (size.bit_length() - 1) // 10 - 1))]
+    return f"{size / divisor:.2f} {unit}"
+
+
+def _codec_summary(info):
+    """Return the codec names, comma-separated per stream type and " / " between types."""
+    # Empty stream types are skipped; the codec name falls back to the short name
+    return " / ".join(
+        ", ".join(s.get("codec_long_name") or s.get("codec_name") or "Unknown" for s in streams)
+        for streams in (getattr(info, key) for key in _STREAM_KEYS)
+        if streams)
+
+
 class VideoInfoPanel(wx.Panel):
     """Panel for displaying detailed video information."""
     
-    LABELS = [
-        ("Filename:", "filename"),
-        ("Resolution:", "resolution"),
-        ("Size:", "size"),
-        ("Runtime:", "runtime"),
-        ("Codec:", "codec"),
-        ("Video Streams:", "video_streams"),
-        ("Audio Streams:", "audio_streams"),
-        ("Subtitle Streams:", "subtitle_streams"),
-        ("Data Streams:", "data_streams"),
-    ]
+    # (field key, formatter) pairs; each formatter turns a video info object into the field's text
+    _FIELD_SPECS = (
+        ("filename", lambda i: pathlib.Path(i.filename).name),
+        ("resolution", lambda i: f"{i.max_width}x{i.max_height}"),
+        ("size", _format_size),
+        ("runtime", lambda i: str(i.runtime)),
+        ("codec", _codec_summary),
+        ("video_streams", lambda i: i.get_stream_descriptions("video")),
+        ("audio_streams", lambda i: i.get_stream_descriptions("audio")),
+        ("subtitle_streams", lambda i: i.get_stream_descriptions("subtitle")),
+        ("data_streams", lambda i: i.get_stream_descriptions("data")),
+    )
 
     def __init__(self, parent, app_state: "AppState"):
         super().__init__(parent)
         self.app_state = app_state
         self.fields = {}
         self.InitUI()
+        # Resolve each spec's control once, so updates don't look fields up by key
+        self._field_updates = tuple((self.fields[key], fmt) for key, fmt in self._FIELD_SPECS)
 
     def InitUI(self):
         """Initialize the UI elements for video information display."""
@@ -36,7 +62,7 @@ class VideoInfoPanel(wx.Panel):
         # Row 1: Filename (full width since it can be long)
         filename_sizer = wx.BoxSizer(wx.HORIZONTAL)
         filename_label = wx.StaticText(self, label="Filename:")
-        filename_label.SetMinSize(wx.Size(80, -1))
+        filename_label.SetMinSize((80, -1))
         self.fields["filename"] = wx.TextCtrl(self, style=wx.TE_READONLY)
         filename_sizer.Add(filename_label, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 3)
         filename_sizer.Add(self.fields["filename"], 1, wx.ALL | wx.EXPAND, 3)
@@ -47,21 +73,21 @@ class VideoInfoPanel(wx.Panel):
         
         # Resolution
         res_label = wx.StaticText(self, label="Resolution:")
-        res_label.SetMinSize(wx.Size(80, -1))
+        res_label.SetMinSize((80, -1))
         self.fields["resolution"] = wx.TextCtrl(self, style=wx.TE_READONLY)
-        self.fields["resolution"].SetMinSize(wx.Size(100, -1))
+        self.fields["resolution"].SetMinSize((100, -1))
         
         # Size
         size_label = wx.StaticText(self, label="Size:")
-        size_label.SetMinSize(wx.Size(40, -1))
+        size_label.SetMinSize((40, -1))
         self.fields["size"] = wx.TextCtrl(self, style=wx.TE_READONLY)
-        self.fields["size"].SetMinSize(wx.Size(100, -1))
+        self.fields["size"].SetMinSize((100, -1))
         
         # Runtime
         runtime_label = wx.StaticText(self, label="Runtime:")
-        runtime_label.SetMinSize(wx.Size(60, -1))
+        runtime_label.SetMinSize((60, -1))
         self.fields["runtime"] = wx.TextCtrl(self, style=wx.TE_READONLY)
-        self.fields["runtime"].SetMinSize(wx.Size(120, -1))
+        self.fields["runtime"].SetMinSize((120, -1))
         
         info_sizer.Add(res_label, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 3)
         info_sizer.Add(self.fields["resolution"], 0, wx.ALL, 3)
@@ -74,7 +100,7 @@ class VideoInfoPanel(wx.Panel):
         # Row 3: Codec summary (full width since it can be long)
         codec_sizer = wx.BoxSizer(wx.HORIZONTAL)
         codec_label = wx.StaticText(self, label="Codecs:")
-        codec_label.SetMinSize(wx.Size(80, -1))
+        codec_label.SetMinSize((80, -1))
         self.fields["codec"] = wx.TextCtrl(self, style=wx.TE_READONLY)
         codec_sizer.Add(codec_label, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 3)
         codec_sizer.Add(self.fields["codec"], 1, wx.ALL | wx.EXPAND, 3)
@@ -85,15 +111,15 @@ class VideoInfoPanel(wx.Panel):
         
         # Video streams
         video_label = wx.StaticText(self, label="Video:")
-        video_label.SetMinSize(wx.Size(50, -1))
+        video_label.SetMinSize((50, -1))
         self.fields["video_streams"] = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY)
-        self.fields["video_streams"].SetMinSize(wx.Size(-1, 40))
+        self.fields["video_streams"].SetMinSize((-1, 40))
         
         # Audio streams  
         audio_label = wx.StaticText(self, label="Audio:")
-        audio_label.SetMinSize(wx.Size(50, -1))
+        audio_label.SetMinSize((50, -1))
         self.fields["audio_streams"] = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY)
-        self.fields["audio_streams"].SetMinSize(wx.Size(-1, 40))
+        self.fields["audio_streams"].SetMinSize((-1, 40))
         
         stream_row1_sizer.Add(video_label, 0, wx.ALL | wx.ALIGN_TOP, 3)
         stream_row1_sizer.Add(self.fields["video_streams"], 1, wx.ALL | wx.EXPAND, 3)
@@ -106,15 +132,15 @@ class VideoInfoPanel(wx.Panel):
         
         # Subtitle streams
         subtitle_label = wx.StaticText(self, label="Subtitles:")
-        subtitle_label.SetMinSize(wx.Size(60, -1))
+        subtitle_label.SetMinSize((60, -1))
         self.fields["subtitle_streams"] = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY)
-        self.fields["subtitle_streams"].SetMinSize(wx.Size(-1, 40))
+        self.fields["subtitle_streams"].SetMinSize((-1, 40))
         
         # Data streams
         data_label = wx.StaticText(self, label="Data:")
-        data_label.SetMinSize(wx.Size(40, -1))
+        data_label.SetMinSize((40, -1))
         self.fields["data_streams"] = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY)
-        self.fields["data_streams"].SetMinSize(wx.Size(-1, 40))
+        self.fields["data_streams"].SetMinSize((-1, 40))
         
         stream_row2_sizer.Add(subtitle_label, 0, wx.ALL | wx.ALIGN_TOP, 3)
         stream_row2_sizer.Add(self.fields["subtitle_streams"], 1, wx.ALL | wx.EXPAND, 3)
@@ -126,32 +152,21 @@ class VideoInfoPanel(wx.Panel):
 
     def update_info(self, info):
         """Update the display with video information."""
-        self.fields["filename"].SetValue(pathlib.Path(info.filename).name)
-        self.fields["resolution"].SetValue(f"{info.max_width}x{info.max_height}")
-        size = (f"{info.size_kb:.2f} KB" if info.size_kb < 1024 else
-                f"{info.size_mb:.2f} MB" if info.size_mb < 1024 else
-                f"{info.size_gb:.2f} GB")
-        self.fields["size"].SetValue(size)
-        self.fields["runtime"].SetValue(str(info.runtime))
-        codec_list = []
-
-        for key in ("video_streams", "audio_streams", "subtitle_streams", "data_streams"):
-            streams = getattr(info, key)
-            if streams:
-                codec_names = []
-                for s in streams:
-                    # Safely get codec name with fallbacks
-                    codec_name = s.get("codec_long_name") or s.get("codec_name") or "Unknown"
-                    codec_names.append(codec_name)
-                if codec_names:
-                    codec_list.append(", ".join(codec_names))
-
-        self.fields["codec"].SetValue(" / ".join(codec_list))
-        self.fields["audio_streams"].SetValue(
-            "\n".join(info.get_audio_stream_description(s) for s in info.audio_streams).strip())
-        self.fields["video_streams"].SetValue(
-            "\n".join(info.get_video_stream_description(s) for s in info.video_streams).strip())
-        self.fields["subtitle_streams"].SetValue(
-            "\n".join(info.get_subtitle_stream_description(s) for s in info.subtitle_streams).strip())
-        self.fields["data_streams"].SetValue(
-            "\n".join(info.get_data_stream_description(s) for s in info.data_streams).strip())
+        # Batch the field updates into a single repaint
+        self.Freeze()
+        try:
+            self._update_fields(info)
+        finally:
+            self.Thaw()
+
+    @staticmethod
+    def _set(ctrl, value):
+        """Set a read-only field's text, skipping the write if it is unchanged."""
+        # ChangeValue rather than SetValue, since nothing listens for EVT_TEXT here
+        if ctrl.GetValue() != value:
+            ctrl.ChangeValue(value)
+
+    def _update_fields(self, info):
+        """Write the video information into the display fields."""
+        for ctrl, fmt in self._field_updates:
+            self._set(ctrl, fmt(info))
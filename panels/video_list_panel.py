@@ -1,25 +1,299 @@
 #!/usr/bin/env python
 
 import wx
+import contextlib
 import pathlib
 import threading
+import logging
 import re
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import TYPE_CHECKING, Optional
 
 import modules.video as video
 from modules.video import VIDEO_EXTENSIONS, VideoProcessingError, FFmpegNotFoundError, VideoFileError
-from modules.logging_config import get_logger
+from modules.probe_cache import ProbeCache
+from modules.logging_config import get_logger, log_error_with_context
+
+try:
+    import re2  # Optional: linear-time matching keeps the filter fast on large lists
+except ImportError:
+    re2 = None
 
 if TYPE_CHECKING:
     from app_state import AppState
 
 logger = get_logger('video_list')
 
+# Lower-cased video extensions, for matching directory entry names
+_VIDEO_EXT_SET = frozenset(ext.lower() for ext in VIDEO_EXTENSIONS)
+
+# Whether file names are compared case-insensitively by the usual filesystems here (NTFS, APFS)
+_CASE_INSENSITIVE_FS = sys.platform in ("win32", "darwin")
+
+# Deleting more files than this at once spreads the unlinks over _DELETE_WORKERS threads
+_DELETE_POOL_THRESHOLD = 64
+_DELETE_WORKERS = 16
+# Number of delete errors listed in the results message
+_MAX_REPORTED_ERRORS = 5
+
+# Deletes the characters not allowed in a renamed file's name; a name is invalid if this shortens it
+_INVALID_CHARS_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+
+
+def _iter_video_files(root, depth=0, dir_mtimes=None, entries=None):
+    """Yield paths of video files under root, down to depth levels (0 for unlimited).
+    
+    Level 1 is root itself. Directory symlinks are not followed. If dir_mtimes is
+    given, each scanned directory's st_mtime_ns is recorded in it. If entries is
+    given, each yielded file's os.DirEntry is stored in it by path string, so its
+    cached stat() can be reused.
+    """
+    stack = [(str(root), 1)]
+    while stack:
+        dir_path, level = stack.pop()
+        try:
+            if dir_mtimes is not None:
+                # Taken before listing, so a change made mid-scan shows up next time
+                dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+            it = os.scandir(dir_path)
+        except OSError as e:
+            logger.warning(f"Could not scan directory {dir_path}: {e}")
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth == 0 or level < depth:
+                            stack.append((entry.path, level + 1))
+                        continue
+                    name = entry.name
+                    dot = name.rfind('.')
+                    # dot > 0 so that e.g. ".mkv" alone isn't treated as an extension
+                    if dot > 0 and name[dot:].lower() in _VIDEO_EXT_SET and entry.is_file():
+                        if entries is not None:
+                            entries[entry.path] = entry
+                        yield pathlib.Path(entry.path)
+                except OSError:
+                    continue
+
+
+def _delete_files(directory, filenames, progress=None):
+    """Delete filenames (relative to directory). Return (names deleted, errors, failure count).
+    
+    Where the platform allows it, the directory is opened once and files are unlinked
+    relative to it, so the kernel doesn't walk the full path for every file. Large
+    batches are unlinked from a few threads at once, which hides per-file latency on
+    network filesystems. Only the first _MAX_REPORTED_ERRORS error strings are kept.
+    If given, progress is called with the number of files handled so far after each one.
+    """
+    deleted = []
+    errors = []
+    failed = 0
+    dir_fd = None
+    if os.unlink in os.supports_dir_fd:
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        except OSError as e:
+            logger.debug(f"Could not open {directory}, deleting by full path: {e}")
+    dir_str = os.fspath(directory)
+    
+    def unlink(filename):
+        """Delete one file; return None, or the error message."""
+        try:
+            # Unlink straight away; a missing file shows up as FileNotFoundError,
+            # so there's no need for a separate exists() check first
+            if dir_fd is not None:
+                os.unlink(filename, dir_fd=dir_fd)
+            else:
+                os.unlink(os.path.join(dir_str, filename))
+        except FileNotFoundError:
+            return "File not found"
+        except Exception as e:
+            logger.error("Failed to delete %s: %s", filename, e)
+            return str(e)
+        logger.debug("Deleted file: %s", filename)
+        return None
+    
+    try:
+        with contextlib.ExitStack() as stack:
+            # Small batches aren't worth starting threads for
+            if len(filenames) > _DELETE_POOL_THRESHOLD:
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=_DELETE_WORKERS))
+                results = executor.map(unlink, filenames)
+            else:
+                results = map(unlink, filenames)
+            for done, (filename, error) in enumerate(zip(filenames, results), 1):
+                if error is None:
+                    deleted.append(filename)
+                else:
+                    # Only a few errors are shown, so don't build messages for the rest
+                    failed += 1
+                    if failed <= _MAX_REPORTED_ERRORS:
+                        errors.append(f"{filename}: {error}")
+                if progress is not None:
+                    progress(done)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    # One record for the batch; failures were already logged individually
+    logger.info("Deleted %d of %d file(s) in %s", len(deleted), len(filenames), dir_str)
+    return deleted, errors, failed
+
+
+def _dirs_unchanged(dir_mtimes):
+    """Return True if every directory in dir_mtimes still has its recorded mtime."""
+    try:
+        return all(os.stat(d).st_mtime_ns == m for d, m in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+def _compile_filter(pattern):
+    """Compile a case-insensitive filter regex, using RE2 if it's installed and accepts the pattern.
+    
+    Raises re.error for an invalid pattern.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile("(?i)" + pattern)
+        except Exception:
+            pass  # RE2 lacks e.g. backreferences and lookarounds, so let re handle those
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _sort_key_for(column):
+    """Return the function giving a row's sort key for column.
+    
+    The filename breaks ties, so rows with equal keys keep a stable order.
+    """
+    if column == 0:
+        return lambda row: row.sort_keys[0]
+    if column == 1:
+        # The rename preview isn't known from the video info, so it sorts on its cell text
+        return lambda row: (row.cells[1].lower(), row.sort_keys[0])
+    return lambda row: (row.sort_keys[column], row.sort_keys[0])
+
+
+def _relative_str(abs_path, dir_str):
+    """Return abs_path relative to dir_str using string operations, or None if it's outside it."""
+    prefix = dir_str if dir_str.endswith(os.sep) else dir_str + os.sep
+    if abs_path.startswith(prefix):
+        return abs_path[len(prefix):]
+    return None
+
+
+class _RowView:
+    """Display strings and sort keys for a video's row, built once per probe rather than per insert."""
+    __slots__ = ("video_codec", "audio_codec", "res", "runtime", "size_str", "sort_keys")
+
+    def __init__(self, info_obj):
+        video_codec = audio_codec = res = runtime = size_str = ""
+        width = height = duration = size = 0
+
+        if info_obj:
+            if info_obj.video_streams:
+                video_codec = info_obj.video_streams[0].get("codec_name", "")
+
+            if info_obj.audio_streams:
+                audio_codec = info_obj.audio_streams[0].get("codec_name", "")
+
+            if info_obj.max_width and info_obj.max_height:
+                width, height = info_obj.max_width, info_obj.max_height
+                res = f"{width}x{height}"
+            duration = info_obj.duration
+            
+            # Add runtime information
+            runtime = info_obj.runtime if hasattr(info_obj, 'runtime') and info_obj.runtime else ""
+
+            size = info_obj.size
+            if info_obj.size_kb < 1024:
+                size_str = f"{info_obj.size_kb:.2f} KB"
+            elif info_obj.size_mb < 1024:
+                size_str = f"{info_obj.size_mb:.2f} MB"
+            else:
+                size_str = f"{info_obj.size_gb:.2f} GB"
+        else:
+            # Mark files that failed to process
+            video_codec = "ERROR"
+
+        self.video_codec = video_codec
+        self.audio_codec = audio_codec
+        self.res = res
+        self.runtime = runtime
+        self.size_str = size_str
+        # Sort keys for the codec, resolution, runtime and size columns (2-6)
+        self.sort_keys = (video_codec.lower(), audio_codec.lower(), (width, height), duration, size)
+
+
+class _Row:
+    """One file's row in the list: its paths, the text of each column and its sort keys."""
+    __slots__ = ("rel", "abs_path", "cells", "sort_keys", "search_text")
+
+    def __init__(self, rel, abs_path, view):
+        self.rel = rel
+        self.abs_path = abs_path
+        # Column 1 is the rename preview, empty until rename mode fills it in
+        self.cells = [rel, "", view.video_codec, view.audio_codec, view.res, view.runtime, view.size_str]
+        # Typed sort keys, aligned with the columns; only the rename preview is sorted on its text
+        self.sort_keys = (rel.lower(), None) + view.sort_keys
+        # Lower-cased text of all columns for the filter, built on first use
+        self.search_text = None
+
+
+class _DirListings:
+    """Names of the files in directories under root, each listed once with os.scandir.
+
+    Lets rename checks test whether a target exists without a stat() per file. On
+    case-insensitive filesystems names are compared case-folded.
+    """
+    __slots__ = ("root", "_names", "_key")
+
+    def __init__(self, root, case_insensitive=_CASE_INSENSITIVE_FS):
+        self.root = root
+        self._names = {}  # Directory relative to root -> set of (folded) names in it
+        self._key = str.casefold if case_insensitive else str
+
+    def _listing(self, directory):
+        names = self._names.get(directory)
+        if names is None:
+            try:
+                key = self._key
+                with os.scandir(os.path.join(self.root, directory)) as it:
+                    names = {key(entry.name) for entry in it}
+            except OSError:
+                names = set()
+            self._names[directory] = names
+        return names
+
+    def exists(self, rel):
+        """Return whether rel (a path relative to root) names an existing entry."""
+        directory, name = os.path.split(rel)
+        return self._key(name) in self._listing(directory)
+
+    def conflicts(self, new_rel, old_rel):
+        """Return whether renaming old_rel to new_rel would replace some other file."""
+        new_rel = os.path.normpath(new_rel)
+        # A case-only rename on a case-insensitive filesystem "exists" as the file itself
+        return self._key(new_rel) != self._key(old_rel) and self.exists(new_rel)
+
+    def moved(self, old_rel, new_rel):
+        """Record that old_rel was renamed to new_rel."""
+        directory, name = os.path.split(old_rel)
+        self._listing(directory).discard(self._key(name))
+        directory, name = os.path.split(new_rel)
+        self._listing(directory).add(self._key(name))
+
 
 class VideoList(wx.ListCtrl):
     """Custom ListCtrl for displaying and managing video files with sorting capabilities.
     
+    The control is virtual: rows live in Python (all_items, and _rows for the ones shown)
+    and wx only asks for the text of rows it is painting.
+    
     Features:
     - Click column headers to sort by that column
     - Click the same header again to reverse sort order
@@ -42,12 +316,16 @@ class VideoList(wx.ListCtrl):
     ]
 
     def __init__(self, parent, app_state: "AppState", main_frame=None, vid_info_panel=None):
-        super().__init__(parent, style=wx.LC_REPORT | wx.SUNKEN_BORDER)
+        super().__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.SUNKEN_BORDER)
         self.app_state = app_state
         self.main_frame = main_frame
         self.vid_info_panel = vid_info_panel
         self.info_cache = {}  # filename (str) -> video.info object
+        self._row_views = {}  # filename (str) -> _RowView built from its info_cache entry
+        self._cache_lock = threading.Lock()  # Guards writes to info_cache and _row_views from the scan thread
         self.error_files = set()  # Track files that previously failed processing
+        self.probe_cache = ProbeCache()  # ffprobe results kept on disk between runs
+        self._reprobe_all = False  # Ignore the probe cache on the next scan
         
         # Sorting state
         self.sort_column = -1  # Currently sorted column (-1 for none)
@@ -56,7 +334,12 @@ class VideoList(wx.ListCtrl):
         # Filtering state
         self.filter_pattern = ""  # Current filter pattern
         self.compiled_filter = None  # Compiled regex pattern
-        self.all_items = []  # Store all items (including filtered out ones)
+        self._filter_lower = ""  # Lower-cased filter pattern, for plain text search
+        self._last_plain_filter = None  # (all_items, pattern, matching rows) from the last plain text filter
+        self.all_items = []  # _Row for every file, including filtered out ones
+        self._rows = []  # _Row shown at each list index, after filtering and sorting
+        self._checked = set()  # Filenames (relative str) of checked rows
+        self._index_of = None  # Filename (relative str) -> index in _rows, built on demand
         self.use_regex = True  # Whether to treat filter as regex
         
         # Rename mode state
@@ -64,7 +347,11 @@ class VideoList(wx.ListCtrl):
         self.rename_pattern = ""  # Current rename pattern
         self.replace_pattern = ""  # Current replace pattern
         self.case_sensitive = False  # Case sensitive rename
-        self.rename_preview_cache = {}  # Cache for rename previews
+        self.rename_preview_cache = {}  # (name, pattern, replace, case) -> rename preview
+        self._previews_all_empty = True  # No row has a rename preview, so clearing them is a no-op
+        self._bulk_depth = 0  # Nesting depth of _bulk_update() blocks
+        self._last_scan = None  # ((working dir, depth), dir mtimes, files) from the last full scan
+        self._scan_id = 0  # Incremented per refresh, so rows streamed in by an older scan are dropped
 
         for idx, (label, width) in enumerate(self.COLS):
             self.InsertColumn(idx, label)
@@ -76,37 +363,27 @@ class VideoList(wx.ListCtrl):
         self.EnableCheckBoxes()
         self.Bind(wx.EVT_LIST_ITEM_SELECTED, self.OnSelected)
         self.Bind(wx.EVT_LIST_ITEM_CHECKED, self.OnChecked)
+        self.Bind(wx.EVT_LIST_ITEM_UNCHECKED, self.OnChecked)
         self.Bind(wx.EVT_LIST_COL_CLICK, self.OnColumnClick)
         self.refresh()
 
-    def get_video_files_with_depth(self, directory):
+    def get_video_files_with_depth(self, directory, dir_mtimes=None, entries=None):
         """Get video files from directory respecting the recursion depth setting."""
-        directory = pathlib.Path(directory)
+        # 0 is unlimited recursion, 1 is only the directory itself
         depth = self.app_state.config.get("recursion_depth", 0)
-        
-        if depth == 0:
-            # Unlimited recursion (original behavior)
-            return directory.glob("**/*")
-        elif depth == 1:
-            # Only current directory
-            return directory.glob("*")
-        else:
-            # Limited recursion depth
-            files = []
-            for d in range(1, depth + 1):
-                pattern = "/".join(["*"] * d)
-                files.extend(directory.glob(pattern))
-            return files
+        return _iter_video_files(directory, depth, dir_mtimes, entries)
 
     def OnSelected(self, event):
         """Handle video selection in the list."""
+        if self._bulk_depth:
+            return  # Selection being moved along with its row
         selection = self.GetFirstSelected()
         if selection == -1:
             if self.main_frame:
                 self.main_frame.SetStatusText("No selection")
             return
 
-        item = self.GetItemText(selection, 0)
+        item = self._rows[selection].rel
         if self.main_frame:
             self.main_frame.SetStatusText(f"Selected: {item}")
         
@@ -120,7 +397,8 @@ class VideoList(wx.ListCtrl):
         if not info_obj:
             try:
                 info_obj = video.info(self.app_state.selected_video)
-                self.info_cache[str(self.app_state.selected_video)] = info_obj
+                with self._cache_lock:
+                    self.info_cache[str(self.app_state.selected_video)] = info_obj
             except (VideoProcessingError, FFmpegNotFoundError, VideoFileError) as e:
                 if self.main_frame:
                     self.main_frame.SetStatusText(f"Error loading video info: {e}")
@@ -139,19 +417,96 @@ class VideoList(wx.ListCtrl):
         elif self.main_frame and hasattr(self.main_frame, 'show_video_info') and info_obj:
             self.main_frame.show_video_info(info_obj)
 
+    @contextlib.contextmanager
+    def _bulk_update(self):
+        """Freeze painting and ignore selection and check events while the shown rows are replaced."""
+        self._bulk_depth += 1
+        self.Freeze()
+        try:
+            yield
+        finally:
+            self.Thaw()
+            self._bulk_depth -= 1
+
+    def OnGetItemText(self, item, column):
+        """Return the text of a cell, for the virtual list."""
+        return self._rows[item].cells[column]
+
+    def OnGetItemIsChecked(self, item):
+        """Return a row's check state, for the virtual list."""
+        return self._rows[item].rel in self._checked
+
+    def IsItemChecked(self, item):
+        """Return whether the row at index item is checked."""
+        return self._rows[item].rel in self._checked
+
+    def CheckItem(self, item, check=True):
+        """Check or uncheck the row at index item.
+        
+        Virtual rows keep no check state of their own, so it is recorded in _checked.
+        Like other bulk changes, callers run OnChecked(None) afterwards.
+        """
+        rel = self._rows[item].rel
+        if check:
+            self._checked.add(rel)
+        else:
+            self._checked.discard(rel)
+        self.RefreshItem(item)
+
+    def check_all(self, check=True):
+        """Check or uncheck every shown row; callers run OnChecked() afterwards."""
+        if check:
+            self._checked.update(row.rel for row in self._rows)
+        else:
+            self._checked.difference_update(row.rel for row in self._rows)
+        if self._rows:
+            self.RefreshItems(0, len(self._rows) - 1)
+
+    def checked_filenames(self):
+        """Return the filenames (relative str) of the checked rows, in display order."""
+        checked = self._checked
+        return [row.rel for row in self._rows if row.rel in checked]
+
+    def checked_count(self):
+        """Return the number of checked rows."""
+        return len(self._checked)
+
+    def _checked_paths(self):
+        """Return the absolute paths of the checked rows, in display order."""
+        checked = self._checked
+        return [row.abs_path for row in self._rows if row.rel in checked]
+
+    def visible_paths(self):
+        """Return the absolute paths of the shown rows, in display order."""
+        return [row.abs_path for row in self._rows]
+
+    def rename_previews(self):
+        """Return (filename, rename preview) for each shown row."""
+        return [(row.rel, row.cells[1]) for row in self._rows]
+
     def OnChecked(self, event):
         """Handle video checkbox changes."""
-        if self.app_state.working_dir:
-            self.app_state.video_list = [
-                str(self.app_state.working_dir / self.GetItemText(i, 0))
-                for i in range(self.GetItemCount()) if self.IsItemChecked(i)
-            ]
-        else:
+        if event is not None and self._bulk_depth:
+            return
+        if not self.app_state.working_dir:
             self.app_state.video_list = []
+        else:
+            event_type = event.GetEventType() if event is not None else None
+            if event_type in (wx.wxEVT_LIST_ITEM_CHECKED, wx.wxEVT_LIST_ITEM_UNCHECKED):
+                # The user toggled a single row; anything else was a bulk change
+                # that already updated _checked
+                row = self._rows[event.GetIndex()]
+                if event_type == wx.wxEVT_LIST_ITEM_CHECKED:
+                    self._checked.add(row.rel)
+                else:
+                    self._checked.discard(row.rel)
+            # _checked is the source of truth; video_list is rebuilt in display order
+            # only when something reads it, rather than on every click
+            self.app_state.invalidate_video_list(self._checked_paths)
         
         # Update the output preview in the reencode pane
         if self.main_frame and hasattr(self.main_frame, 'reencode_pane'):
-            self.main_frame.reencode_pane.update_output_preview()
+            self.main_frame.reencode_pane.request_preview_update()
         
         # Update the select all checkbox state
         if self.main_frame and hasattr(self.main_frame, 'UpdateSelectAllCheckbox'):
@@ -176,100 +531,44 @@ class VideoList(wx.ListCtrl):
         
         self.sort_items()
 
+    def _sort_rows(self, rows):
+        """Sort rows in place by the current sort column and direction, and return them."""
+        if self.sort_column == -1:
+            return rows
+        rows.sort(key=_sort_key_for(self.sort_column), reverse=not self.sort_ascending)
+        return rows
+
+    def _set_rows(self, rows):
+        """Show rows in the list, in order, keeping the selection on the same file."""
+        with self._bulk_update():
+            selection = self.GetFirstSelected()
+            selected = self._rows[selection].rel if 0 <= selection < len(self._rows) else None
+            if selection != -1:
+                self.SetItemState(selection, 0, wx.LIST_STATE_SELECTED)
+            
+            self._rows = rows
+            self._index_of = None
+            self.SetItemCount(len(rows))
+            if rows:
+                self.RefreshItems(0, len(rows) - 1)
+            
+            if selected is not None:
+                index = self._index_for(selected)
+                if index is not None:
+                    self.SetItemState(index, wx.LIST_STATE_SELECTED, wx.LIST_STATE_SELECTED)
+
+    def _index_for(self, rel_path):
+        """Return the list index of the row for rel_path, or None if it isn't shown."""
+        if self._index_of is None:
+            self._index_of = {row.rel: i for i, row in enumerate(self._rows)}
+        return self._index_of.get(rel_path)
+
     def sort_items(self):
         """Sort the list items based on current sort column and direction."""
-        if self.sort_column == -1 or self.GetItemCount() == 0:
+        if self.sort_column == -1 or not self._rows:
             return
         
-        # Store current check states and selection
-        checked_items = set()
-        selected_item = None
-        
-        for i in range(self.GetItemCount()):
-            if self.IsItemChecked(i):
-                checked_items.add(self.GetItemText(i, 0))
-            if self.GetItemState(i, wx.LIST_STATE_SELECTED):
-                selected_item = self.GetItemText(i, 0)
-        
-        # Collect all row data
-        items = []
-        for i in range(self.GetItemCount()):
-            row_data = []
-            for col in range(self.GetColumnCount()):
-                row_data.append(self.GetItemText(i, col))
-            items.append(row_data)
-        
-        # Sort based on the selected column
-        def sort_key(item):
-            value = item[self.sort_column]
-            
-            if self.sort_column == 0:  # Filename
-                return value.lower()
-            elif self.sort_column == 1:  # Rename Preview
-                return value.lower()
-            elif self.sort_column == 2 or self.sort_column == 3:  # Video/Audio codec (now columns 2,3)
-                return value.lower()
-            elif self.sort_column == 4:  # Resolution (now column 4)
-                if not value or value == "":
-                    return (0, 0)
-                try:
-                    width, height = value.split('x')
-                    return (int(width), int(height))
-                except (ValueError, AttributeError):
-                    return (0, 0)
-            elif self.sort_column == 5:  # Runtime (now column 5)
-                if not value or value == "":
-                    return 0
-                try:
-                    # Parse runtime format like "0:01:23.456789" to seconds for sorting
-                    time_parts = value.split(':')
-                    if len(time_parts) == 3:
-                        hours = int(time_parts[0])
-                        minutes = int(time_parts[1])
-                        seconds = float(time_parts[2])
-                        return hours * 3600 + minutes * 60 + seconds
-                    return 0
-                except (ValueError, IndexError):
-                    return 0
-            elif self.sort_column == 6:  # Size (now column 6)
-                if not value or value == "":
-                    return 0
-                try:
-                    # Extract numeric value and unit
-                    parts = value.split()
-                    if len(parts) == 2:
-                        size_value = float(parts[0])
-                        unit = parts[1].upper()
-                        # Convert to bytes for comparison
-                        if unit == 'KB':
-                            return size_value * 1024
-                        elif unit == 'MB':
-                            return size_value * 1024 * 1024
-                        elif unit == 'GB':
-                            return size_value * 1024 * 1024 * 1024
-                    return float(parts[0]) if parts else 0
-                except (ValueError, IndexError):
-                    return 0
-            
-            return value.lower()
-        
-        # Sort the items
-        items.sort(key=sort_key, reverse=not self.sort_ascending)
-        
-        # Clear and repopulate the list
-        self.DeleteAllItems()
-        for i, row_data in enumerate(items):
-            self.InsertItem(i, row_data[0])
-            for col in range(1, len(row_data)):
-                self.SetItem(i, col, row_data[col])
-        
-        # Restore check states and selection
-        for i in range(self.GetItemCount()):
-            filename = self.GetItemText(i, 0)
-            if filename in checked_items:
-                self.CheckItem(i, True)
-            if filename == selected_item:
-                self.SetItemState(i, wx.LIST_STATE_SELECTED, wx.LIST_STATE_SELECTED)
+        self._set_rows(self._sort_rows(list(self._rows)))
         
         # Update the video list state
         self.OnChecked(None)
@@ -281,13 +580,18 @@ class VideoList(wx.ListCtrl):
             pattern: Filter pattern (regex or plain text)
             use_regex: Whether to treat pattern as regex (default: True)
         """
+        if pattern == self.filter_pattern and use_regex == self.use_regex:
+            # e.g. Enter pressed after the debounce timer already applied this pattern
+            return
+        
         self.filter_pattern = pattern
+        self._filter_lower = pattern.lower()
         self.use_regex = use_regex
         
         # Compile regex pattern if using regex mode
         if self.use_regex and pattern:
             try:
-                self.compiled_filter = re.compile(pattern, re.IGNORECASE)
+                self.compiled_filter = _compile_filter(pattern)
             except re.error as e:
                 # Invalid regex - fall back to plain text search
                 self.compiled_filter = None
@@ -305,49 +609,33 @@ class VideoList(wx.ListCtrl):
             self._show_all_items()
             return
         
-        # Store current check states and selection
-        checked_items = set()
-        selected_item = None
-        
-        for i in range(self.GetItemCount()):
-            if self.IsItemChecked(i):
-                checked_items.add(self.GetItemText(i, 0))
-            if self.GetItemState(i, wx.LIST_STATE_SELECTED):
-                selected_item = self.GetItemText(i, 0)
-        
-        # Store all current items if not already stored
-        if not self.all_items:
-            self._store_all_items()
-        
-        # Filter items
-        filtered_items = []
-        for item_data in self.all_items:
-            if self._item_matches_filter(item_data):
-                filtered_items.append(item_data)
-        
-        # Update the list with filtered items
-        self.DeleteAllItems()
-        for i, item_data in enumerate(filtered_items):
-            self.InsertItem(i, item_data[0])
-            for col in range(1, len(item_data)):
-                if col < len(item_data):
-                    self.SetItem(i, col, item_data[col])
-        
-        # Apply current sorting if any
-        if self.sort_column != -1:
-            self.sort_items()
-        
-        # Restore check states and selection for visible items
-        for i in range(self.GetItemCount()):
-            filename = self.GetItemText(i, 0)
-            if filename in checked_items:
-                self.CheckItem(i, True)
-            if filename == selected_item:
-                self.SetItemState(i, wx.LIST_STATE_SELECTED, wx.LIST_STATE_SELECTED)
+        candidates = self.all_items
+        plain_text = not (self.use_regex and self.compiled_filter)
+        if plain_text:
+            # Typing more of a plain text filter can only narrow the matches, so
+            # only the rows that matched the shorter pattern need checking again
+            last = self._last_plain_filter
+            if last and last[0] is self.all_items and last[1] in self._filter_lower:
+                candidates = last[2]
+        
+        # Pick the matcher once rather than re-checking the mode for every row. Both
+        # search the lower-cased text; the regex is compiled case-insensitive.
+        match = self._filter_lower.__contains__ if plain_text else self.compiled_filter.search
+        rows = []
+        for row in candidates:
+            search_text = row.search_text
+            if search_text is None:
+                search_text = row.search_text = " ".join(row.cells).lower()
+            if match(search_text):
+                rows.append(row)
+        self._last_plain_filter = (self.all_items, self._filter_lower, rows) if plain_text else None
+        # Rows the filter hides lose their check, as video_list only holds shown rows
+        self._checked.intersection_update(row.rel for row in rows)
+        self._set_rows(self._sort_rows(rows))
         
         # Update status
         total_items = len(self.all_items)
-        visible_items = self.GetItemCount()
+        visible_items = len(rows)
         if self.main_frame:
             if visible_items == total_items:
                 self.main_frame.SetStatusText(f"Showing all {total_items} videos")
@@ -357,67 +645,13 @@ class VideoList(wx.ListCtrl):
         # Update the video list state
         self.OnChecked(None)
 
-    def _item_matches_filter(self, item_data):
-        """Check if an item matches the current filter."""
-        if not self.filter_pattern:
-            return True
-        
-        # Search across all columns
-        search_text = " ".join(str(col) for col in item_data).lower()
-        
-        if self.use_regex and self.compiled_filter:
-            return bool(self.compiled_filter.search(search_text))
-        else:
-            # Plain text search (case-insensitive)
-            return self.filter_pattern.lower() in search_text
-
-    def _store_all_items(self):
-        """Store all current items for filtering."""
-        self.all_items = []
-        for i in range(self.GetItemCount()):
-            item_data = []
-            for col in range(self.GetColumnCount()):
-                item_data.append(self.GetItemText(i, col))
-            self.all_items.append(item_data)
-
     def _show_all_items(self):
         """Show all items (clear filter)."""
-        if not self.all_items:
-            return  # Nothing to restore
-        
-        # Store current check states and selection
-        checked_items = set()
-        selected_item = None
-        
-        for i in range(self.GetItemCount()):
-            if self.IsItemChecked(i):
-                checked_items.add(self.GetItemText(i, 0))
-            if self.GetItemState(i, wx.LIST_STATE_SELECTED):
-                selected_item = self.GetItemText(i, 0)
-        
-        # Restore all items
-        self.DeleteAllItems()
-        for i, item_data in enumerate(self.all_items):
-            self.InsertItem(i, item_data[0])
-            for col in range(1, len(item_data)):
-                if col < len(item_data):
-                    self.SetItem(i, col, item_data[col])
-        
-        # Apply current sorting if any
-        if self.sort_column != -1:
-            self.sort_items()
-        
-        # Restore check states and selection
-        for i in range(self.GetItemCount()):
-            filename = self.GetItemText(i, 0)
-            if filename in checked_items:
-                self.CheckItem(i, True)
-            if filename == selected_item:
-                self.SetItemState(i, wx.LIST_STATE_SELECTED, wx.LIST_STATE_SELECTED)
+        self._set_rows(self._sort_rows(list(self.all_items)))
         
         # Update status
         if self.main_frame:
-            self.main_frame.SetStatusText(f"Showing all {self.GetItemCount()} videos")
+            self.main_frame.SetStatusText(f"Showing all {len(self._rows)} videos")
         
         # Update the video list state
         self.OnChecked(None)
@@ -431,214 +665,142 @@ class VideoList(wx.ListCtrl):
     def uncheck_video_by_path(self, video_path):
         """Uncheck a specific video by its absolute path."""
         try:
-            print(f"Attempting to uncheck video: {video_path}")
+            logger.debug(f"Attempting to uncheck video: {video_path}")
             # Convert absolute path to relative path for comparison
             video_path = pathlib.Path(video_path)
             if self.app_state.working_dir:
                 relative_path = str(video_path.relative_to(self.app_state.working_dir))
-                print(f"Looking for relative path: {relative_path}")
+                logger.debug(f"Looking for relative path: {relative_path}")
                 
                 # Find the item in the list
-                for i in range(self.GetItemCount()):
-                    item_text = self.GetItemText(i, 0)
-                    if item_text == relative_path:
-                        print(f"Found matching item at index {i}: {item_text} - unchecking")
-                        self.CheckItem(i, False)
-                        # Update the video list to remove the unchecked item
-                        self.OnChecked(None)
-                        print(f"Video list after unchecking: {[pathlib.Path(v).name for v in self.app_state.video_list]}")
-                        return
+                i = self._index_for(relative_path)
+                if i is not None:
+                    logger.debug(f"Found matching item at index {i}: {relative_path} - unchecking")
+                    self.CheckItem(i, False)
+                    # Update the video list to remove the unchecked item
+                    self.OnChecked(None)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Video list after unchecking: {[pathlib.Path(v).name for v in self.app_state.video_list]}")
+                    return
                 
-                print(f"Could not find item with relative path: {relative_path}")
-                print(f"Available items: {[self.GetItemText(i, 0) for i in range(self.GetItemCount())]}")
+                logger.debug(f"Could not find item with relative path: {relative_path}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Available items: {[row.rel for row in self._rows]}")
         except (ValueError, TypeError) as e:
-            print(f"Could not uncheck video {video_path}: {e}")
+            logger.warning(f"Could not uncheck video {video_path}: {e}")
 
     def recheck_videos_by_paths(self, video_paths):
         """Re-check multiple videos by their absolute paths after a refresh."""
         try:
-            print(f"recheck_videos_by_paths called with {len(video_paths) if video_paths else 0} paths")
+            logger.debug(f"recheck_videos_by_paths called with {len(video_paths) if video_paths else 0} paths")
             if not video_paths or not self.app_state.working_dir:
-                print("No video paths or working directory, returning early")
+                logger.debug("No video paths or working directory, returning early")
                 return
                 
             # Convert all video paths to relative paths for comparison
-            relative_paths = []
+            wd_str = str(self.app_state.working_dir)
+            relative_paths: set[str] = set()
             for video_path in video_paths:
-                try:
-                    video_path = pathlib.Path(video_path)
-                    relative_path = str(video_path.relative_to(self.app_state.working_dir))
-                    relative_paths.append(relative_path)
-                    print(f"Converted {video_path} to relative path: {relative_path}")
-                except (ValueError, TypeError) as e:
-                    print(f"Could not convert video path {video_path}: {e}")
+                relative_path = _relative_str(str(video_path), wd_str)
+                if relative_path is None:
+                    logger.debug("Could not convert video path %s: not under %s", video_path, wd_str)
                     continue
+                relative_paths.add(relative_path)
             
-            print(f"Looking for {len(relative_paths)} relative paths in {self.GetItemCount()} list items")
+            logger.debug(f"Looking for {len(relative_paths)} relative paths in {self.GetItemCount()} list items")
             
             # Check items that match the relative paths
             checked_count = 0
-            for i in range(self.GetItemCount()):
-                item_text = self.GetItemText(i, 0)
-                if item_text in relative_paths:
-                    print(f"Re-checking item {i}: {item_text}")
+            for relative_path in relative_paths:
+                i = self._index_for(relative_path)
+                if i is not None:
+                    logger.debug("Re-checking item %d: %s", i, relative_path)
                     self.CheckItem(i, True)
                     checked_count += 1
             
-            print(f"Successfully re-checked {checked_count} videos")
+            logger.debug(f"Successfully re-checked {checked_count} videos")
             
             # Update the video list with newly checked items
             self.OnChecked(None)
             
         except Exception as e:
-            print(f"Could not recheck videos: {e}")
-            import traceback
-            traceback.print_exc()
+            log_error_with_context(e, "Could not recheck videos", logger)
 
-    def _insert_video_item(self, index, video_path, working_dir, info_cache):
-        """Insert a single video item into the list at the specified index."""
+    def _build_row(self, video_path, working_dir, info_cache):
+        """Build the row for a video file."""
         abs_path = str(video_path)
-        rel_path = str(video_path.relative_to(working_dir))
-        info_obj = info_cache.get(abs_path)
-
-        video_codec = audio_codec = res = runtime = size_str = ""
-
-        if info_obj:
-            if info_obj.video_streams:
-                video_codec = info_obj.video_streams[0].get("codec_name", "")
-
-            if info_obj.audio_streams:
-                audio_codec = info_obj.audio_streams[0].get("codec_name", "")
-
-            res = f"{info_obj.max_width}x{info_obj.max_height}" if info_obj.max_width and info_obj.max_height else ""
-            
-            # Add runtime information
-            runtime = info_obj.runtime if hasattr(info_obj, 'runtime') and info_obj.runtime else ""
-
-            if info_obj.size_kb < 1024:
-                size_str = f"{info_obj.size_kb:.2f} KB"
-            elif info_obj.size_mb < 1024:
-                size_str = f"{info_obj.size_mb:.2f} MB"
-            else:
-                size_str = f"{info_obj.size_gb:.2f} GB"
-        else:
-            # Mark files that failed to process
-            video_codec = "ERROR"
-
-        self.InsertItem(index, rel_path)
-        # Column 1 is now Rename Preview (will be empty initially)
-        self.SetItem(index, 1, "")  # Rename Preview - empty by default
-        self.SetItem(index, 2, video_codec)  # Video codec moved to column 2
-        self.SetItem(index, 3, audio_codec)  # Audio codec moved to column 3  
-        self.SetItem(index, 4, res)          # Resolution moved to column 4
-        self.SetItem(index, 5, runtime)      # Runtime in column 5
-        self.SetItem(index, 6, size_str)     # Size moved to column 6
+        rel_path = _relative_str(abs_path, str(working_dir))
+        if rel_path is None:
+            rel_path = str(video_path.relative_to(working_dir))  # Raises ValueError, as before
+        view = self._row_views.get(abs_path)
+        if view is None:
+            view = _RowView(info_cache.get(abs_path))
+        return _Row(rel_path, abs_path, view)
 
     def _smart_update_list(self, expected_files, working_dir, info_cache):
-        """Smart update that only adds/removes items that have changed."""
-        # Store current check states before making changes
-        checked_items = {}
-        for i in range(self.GetItemCount()):
-            rel_path = self.GetItemText(i, 0)
-            abs_path = str(working_dir / rel_path)
-            if self.IsItemChecked(i):
-                checked_items[abs_path] = True
-
-        # Get current items in the list
-        current_items = {}
-        for i in range(self.GetItemCount()):
-            rel_path = self.GetItemText(i, 0)
-            abs_path = str(working_dir / rel_path)
-            current_items[abs_path] = i
-
-        # Create sets for comparison
-        expected_paths = {str(f) for f in expected_files}
-        current_paths = set(current_items.keys())
-
-        # Find items to remove (exist in current but not in expected)
-        to_remove = current_paths - expected_paths
-        # Find items to add (exist in expected but not in current)
-        to_add = expected_paths - current_paths
-
-        # Remove items in reverse order to maintain indices
-        items_to_remove = [(current_items[path], path) for path in to_remove]
-        items_to_remove.sort(reverse=True)
-        
-        for index, path in items_to_remove:
-            self.DeleteItem(index)
-            logger.debug(f"Removed item at index {index}: {pathlib.Path(path).name}")
-
-        # Add new items
+        """Smart update that keeps the rows of files already listed and only builds new ones."""
+        current_rows = {row.abs_path: row for row in self.all_items}
+        rows = []
+        added = 0
         for file_path in expected_files:
-            abs_path = str(file_path)
-            if abs_path in to_add:
-                # Find the correct insertion position to maintain sorted order
-                insert_index = self._find_insert_position(file_path, expected_files)
-                self._insert_video_item(insert_index, file_path, working_dir, info_cache)
-                logger.debug(f"Added item at index {insert_index}: {file_path.name}")
-
-        # Apply current sorting if any
-        if self.sort_column != -1:
-            self.sort_items()
-        
-        # Update stored items for filtering
-        self._store_all_items()
-        
-        # Re-apply current filter if any
-        if self.filter_pattern:
-            self.apply_filter()
-        
-        # Restore check states for items that still exist (done after filtering)
-        if not self.filter_pattern:  # Only if not filtering
-            for i in range(self.GetItemCount()):
-                rel_path = self.GetItemText(i, 0)
-                abs_path = str(working_dir / rel_path)
-                if abs_path in checked_items:
-                    self.CheckItem(i, True)
-
-        # Update the video list to reflect current checked state
-        self.OnChecked(None)
+            row = current_rows.get(str(file_path))
+            if row is None:
+                row = self._build_row(file_path, working_dir, info_cache)
+                added += 1
+            rows.append(row)
+        logger.debug(f"Smart update: {added} added, {len(current_rows) - (len(rows) - added)} removed")
+        
+        self.all_items = rows
+        # Which rename targets already exist may have changed
+        self.rename_preview_cache.clear()
+        # Forget the check states of files that are gone
+        self._checked.intersection_update(row.rel for row in rows)
+        
+        # Re-apply the current filter and sorting; this also updates the video list
+        self.apply_filter()
 
-    def _find_insert_position(self, new_file, expected_files):
-        """Find the correct position to insert a new file to maintain sorted order."""
-        expected_list = list(expected_files)
-        new_file_index = expected_list.index(new_file)
-        
-        # Count how many files before this one are already in the list
-        files_before = 0
-        for i in range(new_file_index):
-            file_to_check = expected_list[i]
-            rel_path = str(file_to_check.relative_to(self.app_state.working_dir))
-            # Check if this file is already in the list
-            for list_index in range(self.GetItemCount()):
-                if self.GetItemText(list_index, 0) == rel_path:
-                    files_before += 1
-                    break
-        
-        return files_before
-
-    def _update_video_list_for_existing_files(self, expected_files):
-        """Update the app_state.video_list to only include files that still exist."""
-        if not self.app_state.video_list:
+    def remove_items_by_name(self, names):
+        """Drop the rows for filenames (relative str) known to be gone, without rescanning."""
+        names = set(names)
+        if not names:
             return
-            
-        expected_paths = {str(f) for f in expected_files}
-        # Filter video_list to only include files that still exist
-        self.app_state.video_list = [
-            video_path for video_path in self.app_state.video_list 
-            if video_path in expected_paths
-        ]
+        gone = [row.abs_path for row in self.all_items if row.rel in names]
+        with self._cache_lock:
+            for abs_path in gone:
+                self.info_cache.pop(abs_path, None)
+                self._row_views.pop(abs_path, None)
+        for abs_path in gone:
+            video.forget_cached_info(abs_path)
+        self.all_items = [row for row in self.all_items if row.rel not in names]
+        self._checked.difference_update(names)
+        # Which rename targets exist has changed
+        self.rename_preview_cache.clear()
+        
+        # Re-apply the current filter; this also updates the video list
+        self.apply_filter()
+
+    def _add_streamed_rows(self, scan_id, working_dir, paths):
+        """Show rows for files a full refresh has finished probing while it's still scanning."""
+        if scan_id != self._scan_id or self.app_state.working_dir != working_dir:
+            return  # A newer refresh has started
+        # A new list rather than extend(), so the filter sees that the rows changed
+        self.all_items = self.all_items + [self._build_row(p, working_dir, self.info_cache) for p in paths]
+        self.apply_filter()
 
     def clear_error_cache(self):
         """Clear the cache of files that previously failed processing."""
         self.error_files.clear()
+        self._last_scan = None  # Make the next refresh walk again so failed files are retried
         if self.main_frame:
             self.main_frame.SetStatusText("Error file cache cleared - failed files will be retried on next refresh")
     
     def force_refresh_all(self):
         """Force a complete refresh that re-processes all files, including previously failed ones."""
-        self.info_cache.clear()
+        with self._cache_lock:
+            self.info_cache.clear()
+            self._row_views.clear()
         self.error_files.clear()
+        self._reprobe_all = True
         self.refresh(force_full_refresh=True)
         if self.main_frame:
             self.main_frame.SetStatusText("Forcing complete refresh - all files will be re-processed")
@@ -663,16 +825,37 @@ class VideoList(wx.ListCtrl):
 
         if force_full_refresh:
             self.app_state.video_list = []
-            self.DeleteAllItems()
+            self.all_items = []
+            self._checked.clear()
+            self._set_rows([])
 
         wd = self.app_state.working_dir  # capture current working_dir for thread safety
+        reprobe_all, self._reprobe_all = self._reprobe_all, False
+        self._scan_id += 1
+        scan_id = self._scan_id
         def scan_and_update():
             files = []
-            # Preserve existing cache and only update for new/changed files
-            info_cache = self.info_cache.copy()
+            # Preserve existing cache and only update for new/changed files; entries are
+            # added in place under _cache_lock rather than copying the whole dict
+            info_cache = self.info_cache
             errors = []
             new_errors = []  # Track only new errors for this refresh
             
+            # A full refresh starts from an empty list, so show files in batches as
+            # they become ready instead of leaving the list empty until the scan ends
+            streamed = []
+            last_flush = time.monotonic()
+            def file_ready(p):
+                nonlocal streamed, last_flush
+                if not force_full_refresh:
+                    return
+                streamed.append(p)
+                now = time.monotonic()
+                if now - last_flush >= 0.25:
+                    wx.CallAfter(self._add_streamed_rows, scan_id, wd, streamed)
+                    streamed = []
+                    last_flush = now
+            
             try:
                 # Check FFmpeg availability once at the start
                 video.check_ffmpeg_availability()
@@ -681,23 +864,86 @@ class VideoList(wx.ListCtrl):
                                                   "FFmpeg Not Found", wx.OK | wx.ICON_ERROR))
                 return
             
-            # Get current list of files that should be displayed
-            expected_files = []
-            for p in sorted(self.get_video_files_with_depth(wd)):
-                if p.suffix in VIDEO_EXTENSIONS:
-                    abs_path = str(p.resolve())
-                    expected_files.append(p.resolve())
+            # If no directory in the last walk has changed since, the file list can't
+            # have changed either, so reuse it rather than walking the tree again
+            scan_key = (wd, self.app_state.config.get("recursion_depth", 0))
+            last_scan = self._last_scan
+            if (not force_full_refresh and last_scan and last_scan[0] == scan_key
+                    and _dirs_unchanged(last_scan[1])):
+                expected_files = last_scan[2]
+                errors = [f"{p.name}: Previously failed processing"
+                          for p in expected_files if str(p) in self.error_files]
+                logger.debug(f"No directory changes under {wd}, skipping scan")
+            else:
+                dir_mtimes = {}
+                entries = {}  # Path string -> os.DirEntry from the walk
+                # Get current list of files that should be displayed
+                expected_files = []
+                futures = []  # (path, stat, future) for files being probed
+                probed = []  # (path, stat, metadata) to write back to the probe cache
+                # Paths from an absolute working directory are already absolute; resolving them
+                # costs a realpath() per file, so only do that for a relative working directory
+                resolve = not wd.is_absolute()
+                self.probe_cache.load()
+                # Each probe is an ffprobe subprocess, so run several at once. Probes are
+                # submitted as the walk finds files, so the walk overlaps with probing.
+                workers = self.app_state.config.get("probe_workers", min(8, os.cpu_count() or 4))
+                with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                    for p in self.get_video_files_with_depth(wd, dir_mtimes, entries):
+                        if resolve:
+                            p = p.resolve()
+                        abs_path = str(p)
+                        expected_files.append(p)
                     
-                    # Only process files that aren't already in cache
-                    if abs_path not in info_cache:
+                        # Only process files that aren't already in cache
+                        if abs_path in info_cache:
+                            file_ready(p)
+                            continue
                         # Skip files that previously failed unless forced to retry
                         if abs_path in self.error_files:
                             # File previously failed, mark as error but don't retry
                             errors.append(f"{p.name}: Previously failed processing")
+                            file_ready(p)
                             continue
-                            
+
+                        # Files probed in an earlier session are rebuilt from the on-disk cache
+                        # when their mtime and size haven't changed
+                        # DirEntry.stat() is cached, and on Windows comes free with the listing
+                        entry = entries.get(abs_path)
                         try:
-                            info_cache[abs_path] = video.info(abs_path)
+                            st = entry.stat() if entry is not None else os.stat(abs_path)
+                        except OSError:
+                            st = None
+                        metadata = None if (st is None or reprobe_all) else self.probe_cache.get(abs_path, st)
+                        if metadata is not None:
+                            try:
+                                info_obj = video.info(abs_path, metadata=metadata)
+                                view = _RowView(info_obj)
+                                with self._cache_lock:
+                                    info_cache[abs_path] = info_obj
+                                    self._row_views[abs_path] = view
+                                file_ready(p)
+                                continue
+                            except VideoFileError:
+                                pass  # Bad cache entry, probe the file again
+                        futures.append((p, st, executor.submit(video.info, abs_path)))
+
+                    # The walk yields in directory order. A chosen sort column reorders the rows
+                    # anyway; otherwise sort by path string, which is much cheaper than Path compares
+                    if self.sort_column == -1:
+                        expected_files.sort(key=os.fspath)
+                    # Collect in path order so errors are reported in a stable order
+                    futures.sort(key=lambda f: os.fspath(f[0]))
+                    for p, st, future in futures:
+                        abs_path = str(p)
+                        try:
+                            info_obj = future.result()
+                            view = _RowView(info_obj)
+                            with self._cache_lock:
+                                info_cache[abs_path] = info_obj
+                                self._row_views[abs_path] = view
+                            if st is not None:
+                                probed.append((abs_path, st, info_obj.metadata))
                         except (VideoProcessingError, VideoFileError) as e:
                             error_msg = f"{p.name}: {e}"
                             errors.append(error_msg)
@@ -710,6 +956,11 @@ class VideoList(wx.ListCtrl):
                             new_errors.append(error_msg)
                             self.error_files.add(abs_path)  # Remember this file failed
                             logger.error(f"Unexpected error processing {abs_path}: {e}")
+                        file_ready(p)
+
+                self.probe_cache.store(probed)
+                self.probe_cache.prune(str(wd.resolve() if resolve else wd), (str(p) for p in expected_files))
+                self._last_scan = (scan_key, dir_mtimes, expected_files)
 
             files = expected_files
 
@@ -717,56 +968,33 @@ class VideoList(wx.ListCtrl):
                 if self.app_state.working_dir != wd:
                     return
 
-                if force_full_refresh:
-                    # Full refresh - rebuild everything
-                    self.DeleteAllItems()
-                    for i, v in enumerate(files):
-                        self._insert_video_item(i, v, wd, info_cache)
-                    
-                    # Store all items for filtering
-                    self._store_all_items()
-                    
-                    # Apply current filter if any
-                    if self.filter_pattern:
-                        self.apply_filter()
-                    elif self.sort_column != -1:
-                        # Apply current sorting if any and no filter
-                        self.sort_items()
-                else:
-                    # Smart refresh - compare current list with expected files
-                    self._smart_update_list(files, wd, info_cache)
-
-                self.info_cache = info_cache
-                
-                # Only clear video_list if we're doing a full refresh
-                if force_full_refresh:
-                    self.app_state.video_list = []
-                else:
-                    # Update video_list to remove any files that no longer exist
-                    self._update_video_list_for_existing_files(files)
+                # Compare the current rows with the expected files. A full refresh emptied
+                # the list when it started, so this keeps only the rows streamed in since and
+                # builds the rest. Also updates video_list from the checked rows that remain.
+                self._smart_update_list(files, wd, info_cache)
                 
                 # Show error summary only for NEW errors in this refresh
-                if new_errors and self.main_frame:
-                    error_count = len(new_errors)
-                    total_error_count = len(errors)
+                if errors and self.main_frame:
+                    file_count = len(files)
+                    new_count = len(new_errors)
+                    total_count = len(errors)
                     
-                    if total_error_count > len(new_errors):
-                        status_msg = f"Loaded {len(files)} files ({error_count} new errors, {total_error_count} total errors)"
+                    if not new_count:
+                        # Only old errors, just update status
+                        self.main_frame.SetStatusText(f"Loaded {file_count} files ({total_count} known errors)")
                     else:
-                        status_msg = f"Loaded {len(files)} files ({error_count} errors)"
-                    self.main_frame.SetStatusText(status_msg)
-                    
-                    if error_count <= 5:  # Show details for few errors
-                        error_msg = f"New errors processing {error_count} files:\n\n" + "\n".join(new_errors)
-                    else:  # Summarize for many errors
-                        error_msg = f"New errors processing {error_count} files. First 5:\n\n" + "\n".join(new_errors[:5]) + f"\n\n... and {error_count - 5} more"
-                    
-                    wx.CallAfter(lambda: wx.MessageBox(error_msg, "Video Processing Errors", wx.OK | wx.ICON_WARNING))
-                elif errors and not new_errors and self.main_frame:
-                    # Only old errors, just update status
-                    error_count = len(errors)
-                    status_msg = f"Loaded {len(files)} files ({error_count} known errors)"
-                    self.main_frame.SetStatusText(status_msg)
+                        if total_count > new_count:
+                            status_msg = f"Loaded {file_count} files ({new_count} new errors, {total_count} total errors)"
+                        else:
+                            status_msg = f"Loaded {file_count} files ({new_count} errors)"
+                        self.main_frame.SetStatusText(status_msg)
+                        
+                        if new_count <= 5:  # Show details for few errors
+                            error_msg = f"New errors processing {new_count} files:\n\n" + "\n".join(new_errors)
+                        else:  # Summarize for many errors
+                            error_msg = f"New errors processing {new_count} files. First 5:\n\n" + "\n".join(new_errors[:5]) + f"\n\n... and {new_count - 5} more"
+                        
+                        wx.CallAfter(lambda: wx.MessageBox(error_msg, "Video Processing Errors", wx.OK | wx.ICON_WARNING))
 
                 # Call the completion callback if provided
                 if completion_callback:
@@ -777,7 +1005,7 @@ class VideoList(wx.ListCtrl):
 
     def set_rename_mode(self, enabled, rename_pattern="", replace_pattern="", case_sensitive=False):
         """Enable or disable rename mode and update the preview column."""
-        print(f"DEBUG: set_rename_mode called - enabled={enabled}, pattern='{rename_pattern}', replace='{replace_pattern}', case={case_sensitive}")
+        logger.debug(f"set_rename_mode called - enabled={enabled}, pattern='{rename_pattern}', replace='{replace_pattern}', case={case_sensitive}")
         
         self.rename_mode = enabled
         self.rename_pattern = rename_pattern
@@ -786,9 +1014,7 @@ class VideoList(wx.ListCtrl):
         
         # Show/hide the rename preview column (index 1)
         preview_col_idx = 1
-        print(f"DEBUG: Preview column index: {preview_col_idx}")
         if enabled:
-            print(f"DEBUG: Showing preview column with width {self.COLS[preview_col_idx][1]}")
             self.SetColumnWidth(preview_col_idx, self.COLS[preview_col_idx][1])  # Show with default width
             # Always update previews when patterns change, even if mode was already enabled
             self.update_rename_previews()
@@ -798,101 +1024,114 @@ class VideoList(wx.ListCtrl):
     
     def update_rename_patterns(self, rename_pattern, replace_pattern, case_sensitive):
         """Update rename patterns and refresh previews without changing column visibility."""
-        print(f"DEBUG: update_rename_patterns called - pattern='{rename_pattern}', replace='{replace_pattern}', case={case_sensitive}")
+        logger.debug(f"update_rename_patterns called - pattern='{rename_pattern}', replace='{replace_pattern}', case={case_sensitive}")
         self.rename_pattern = rename_pattern
         self.replace_pattern = replace_pattern
         self.case_sensitive = case_sensitive
         if self.rename_mode:
-            print("DEBUG: Rename mode is enabled, calling update_rename_previews")
             self.update_rename_previews()
-        else:
-            print("DEBUG: Rename mode is disabled")
     
     def update_rename_previews(self):
         """Update the rename preview column for all visible items."""
-        print(f"DEBUG: update_rename_previews called - mode={self.rename_mode}, pattern='{self.rename_pattern}', replace='{self.replace_pattern}'")
-        print(f"DEBUG: Item count: {self.GetItemCount()}")
-        
-        if not self.rename_mode:
-            # Clear all preview values if rename mode is disabled, but only if they're not already empty
-            for i in range(self.GetItemCount()):
-                current_preview = self.GetItemText(i, 1)  # Column 1 is rename preview
-                if current_preview:  # Only update if not already empty
-                    self.SetItem(i, 1, "")
-            return
-            
-        # If no pattern is provided, clear previews only if they're not already empty
-        if not self.rename_pattern:
-            print("DEBUG: No rename pattern, clearing previews")
-            for i in range(self.GetItemCount()):
-                current_preview = self.GetItemText(i, 1)  # Column 1 is rename preview
-                if current_preview:  # Only update if not already empty
-                    print(f"DEBUG: Clearing preview for item {i}")
-                    self.SetItem(i, 1, "")
+        if not self.rename_mode or not self.rename_pattern:
+            # Clear all preview values if rename mode is disabled or there is no pattern.
+            # Rows hidden by the filter are cleared too, so the flag covers every row.
+            if not self._previews_all_empty:
+                self._set_previews(lambda row: "", self.all_items)
+                self._previews_all_empty = True
             return
+        self._previews_all_empty = False
         
         # Compile regex
         try:
             flags = 0 if self.case_sensitive else re.IGNORECASE
             regex = re.compile(self.rename_pattern, flags)
         except re.error:
-            # Show error in all preview cells, but only if they don't already show the error
-            for i in range(self.GetItemCount()):
-                current_preview = self.GetItemText(i, 1)  # Column 1 is rename preview
-                if current_preview != "ERROR: Invalid regex":
-                    self.SetItem(i, 1, "ERROR: Invalid regex")
+            # Show error in all preview cells
+            self._set_previews(lambda row: "ERROR: Invalid regex")
             return
         
-        # Update preview for each visible item
-        for i in range(self.GetItemCount()):
-            original_name = self.GetItemText(i, 0)
-            print(f"DEBUG: Processing item {i}: '{original_name}'")
-            
+        # Loop invariants
+        subn = regex.subn
+        replace = self.replace_pattern
+        wd = self.app_state.working_dir
+        table = _INVALID_CHARS_TABLE
+        sep, altsep = os.sep, os.altsep
+        cache = self.rename_preview_cache
+        key_suffix = (self.rename_pattern, replace, self.case_sensitive)
+        if len(cache) > 20000:
+            cache.clear()
+        conflicts = _DirListings(wd).conflicts if wd else None
+        
+        cache_get = cache.get
+        
+        def preview_for(row):
+            key = (row.rel,) + key_suffix
+            preview = cache_get(key)
+            if preview is None:
+                preview = cache[key] = compute_preview(row.rel)
+            return preview
+        
+        def compute_preview(original_name):
             try:
                 # Apply regex substitution
-                new_name = regex.sub(self.replace_pattern, original_name)
+                new_name, count = subn(replace, original_name)
                 
-                # Check if name changed and validate
-                if new_name == original_name:
+                # Check if name changed and validate; no matches means no change without
+                # comparing the strings, but a match can still be replaced with itself
+                if not count or new_name == original_name:
                     preview = "No change"
                 elif not new_name or new_name.isspace():
                     preview = "ERROR: Empty name"
                 else:
-                    # Split path to validate only the filename part, not the directory path
-                    directory_part = os.path.dirname(new_name)
-                    filename_part = os.path.basename(new_name)
+                    # Validate only the filename part, not the directory path. Most new names
+                    # have no directory, so only split when there's a separator.
+                    filename_part = new_name
+                    if sep in filename_part:
+                        filename_part = filename_part.rpartition(sep)[2]
+                    if altsep and altsep in filename_part:
+                        filename_part = filename_part.rpartition(altsep)[2]
                     
                     # Check for invalid characters only in the filename part
-                    if any(char in filename_part for char in '<>:"/\\|?*'):
+                    if len(filename_part.translate(table)) != len(filename_part):
                         preview = "ERROR: Invalid characters"
                     elif not filename_part or filename_part.isspace():
                         preview = "ERROR: Empty filename"
                     else:
                         # Check if file would exist
-                        if self.app_state.working_dir:
-                            new_path = self.app_state.working_dir / new_name
-                            old_path = self.app_state.working_dir / original_name
-                            if new_path.exists() and new_path != old_path:
+                        if wd:
+                            if conflicts(new_name, original_name):
                                 preview = f"WARNING: {new_name}"
                             else:
                                 preview = new_name
                         else:
                             preview = new_name
                 
-                print(f"DEBUG: Final preview text: '{preview}'")
-                # Only update if the preview text actually changed
-                current_preview = self.GetItemText(i, 1)  # Column 1 is rename preview
-                if current_preview != preview:
-                    print(f"DEBUG: Setting preview for item {i} from '{current_preview}' to '{preview}'")
-                    self.SetItem(i, 1, preview)
-                else:
-                    print(f"DEBUG: Preview unchanged for item {i}: '{current_preview}'")
+                return preview
                 
             except Exception as e:
-                error_text = f"ERROR: {str(e)[:30]}"
-                current_preview = self.GetItemText(i, 1)  # Column 1 is rename preview
-                if current_preview != error_text:
-                    self.SetItem(i, 1, error_text)
+                return f"ERROR: {str(e)[:30]}"
+        
+        # Update preview for each visible item
+        self._set_previews(preview_for)
+
+    def _set_previews(self, preview_for, rows=None):
+        """Set the rename preview of each row (default: the shown rows) to preview_for(row).
+        
+        Redraws only if any changed.
+        """
+        changed = False
+        for row in self._rows if rows is None else rows:
+            preview = preview_for(row)
+            cells = row.cells
+            if cells[1] != preview:
+                cells[1] = preview
+                row.search_text = None  # The preview is searched too
+                changed = True
+        if changed:
+            self._last_plain_filter = None  # Matches may differ now
+            if self._rows:
+                self.RefreshItems(0, len(self._rows) - 1)
 
     def apply_renames(self):
         """Apply the rename operations based on current preview."""
@@ -901,10 +1140,14 @@ class VideoList(wx.ListCtrl):
         
         success_count = 0
         errors = []
-        
-        for i in range(self.GetItemCount()):
-            original_name = self.GetItemText(i, 0)
-            preview = self.GetItemText(i, 1)  # Rename Preview is column 1
+        wd = self.app_state.working_dir
+        listings = _DirListings(wd) if wd else None
+        conflicts = listings.conflicts if wd else None
+        moved = listings.moved if wd else None
+        
+        for row in self._rows:
+            original_name = row.rel
+            preview = row.cells[1]  # Rename Preview is column 1
             
             # Skip if no change or error
             if preview in ["No change", ""] or preview.startswith("ERROR:"):
@@ -917,19 +1160,20 @@ class VideoList(wx.ListCtrl):
                 new_name = preview
             
             # Perform the rename
-            if self.app_state.working_dir:
+            if wd:
                 try:
-                    old_path = self.app_state.working_dir / original_name
-                    new_path = self.app_state.working_dir / new_name
+                    old_path = wd / original_name
+                    new_path = wd / new_name
                     
                     # Only rename if actually different
                     if old_path != new_path:
                         # Check if target already exists (should have been caught earlier)
-                        if new_path.exists():
+                        if conflicts(new_name, original_name):
                             # This is an overwrite - log it but proceed since user confirmed
                             logger.warning(f"Overwriting existing file: {new_name}")
                         
                         old_path.rename(new_path)
+                        moved(original_name, new_name)
                         success_count += 1
                         logger.info(f"Renamed: {original_name} → {new_name}")
                         
@@ -1064,10 +1308,12 @@ class VideoListPanel(wx.Panel):
         
         # Timer for live filtering (to avoid filtering on every keystroke)
         self.filter_timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.OnFilterTimer)
+        self.Bind(wx.EVT_TIMER, self.OnFilterTimer, self.filter_timer)
         
-        # Timer for rename preview updates
-        self.rename_timer = None
+        # Timer for rename preview updates, and the (find, replace, case) last previewed
+        self.rename_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.OnRenameTimerExpired, self.rename_timer)
+        self.last_rename_patterns = None
     
     def OnFilterText(self, event):
         """Handle text changes in the filter box."""
@@ -1155,9 +1401,7 @@ class VideoListPanel(wx.Panel):
             replace_pattern = self.rename_replace_text.GetValue()
             case_sensitive = self.rename_case_cb.GetValue()
             self.video_list.set_rename_mode(True, find_pattern, replace_pattern, case_sensitive)
-            
-            # Start a periodic timer to monitor text changes
-            self.start_rename_monitoring()
+            self.last_rename_patterns = (find_pattern, replace_pattern, case_sensitive)
             
             self.Layout()
     
@@ -1167,108 +1411,36 @@ class VideoListPanel(wx.Panel):
             self.rename_bar.Hide()
             self.video_list.set_rename_mode(False)
             
-            # Stop monitoring timer
-            self.stop_rename_monitoring()
+            # Drop any pending preview update
+            self.rename_timer.Stop()
+            self.last_rename_patterns = None
             
             self.Layout()
     
-    def start_rename_monitoring(self):
-        """Start monitoring text changes with a periodic timer."""
-        print("DEBUG: start_rename_monitoring called")
-        # Stop any existing monitoring
-        self.stop_rename_monitoring()
-        
-        # Use CallLater approach instead of wx.Timer for better reliability
-        self.rename_monitoring_active = True
-        
-        # Store current values
-        self.last_find_pattern = self.rename_find_text.GetValue()
-        self.last_replace_pattern = self.rename_replace_text.GetValue()
-        self.last_case_sensitive = self.rename_case_cb.GetValue()
-        print(f"DEBUG: Initial values - find='{self.last_find_pattern}', replace='{self.last_replace_pattern}', case={self.last_case_sensitive}")
-        
-        # Start the monitoring loop
-        self.schedule_rename_check()
-    
-    def schedule_rename_check(self):
-        """Schedule the next rename field check."""
-        if hasattr(self, 'rename_monitoring_active') and self.rename_monitoring_active:
-            wx.CallLater(500, self.check_rename_changes)
-    
-    def check_rename_changes(self):
-        """Check if rename fields have changed and update preview if needed."""
-        print("DEBUG: check_rename_changes called")
-        
-        # Check if monitoring should continue
-        if not hasattr(self, 'rename_monitoring_active') or not self.rename_monitoring_active:
-            print("DEBUG: Monitoring not active, stopping")
-            return
-            
-        if not hasattr(self, 'rename_bar') or not self.rename_bar.IsShown():
-            print("DEBUG: Rename bar not shown, stopping monitoring")
-            self.stop_rename_monitoring()
-            return
-        
-        # Get current values
-        current_find = self.rename_find_text.GetValue()
-        current_replace = self.rename_replace_text.GetValue()
-        current_case = self.rename_case_cb.GetValue()
-        print(f"DEBUG: Current values - find='{current_find}', replace='{current_replace}', case={current_case}")
-        
-        # Check if anything changed
-        if (current_find != self.last_find_pattern or 
-            current_replace != self.last_replace_pattern or 
-            current_case != self.last_case_sensitive):
-            
-            print("DEBUG: Change detected, updating patterns")
-            # Update stored values
-            self.last_find_pattern = current_find
-            self.last_replace_pattern = current_replace
-            self.last_case_sensitive = current_case
-            
-            # Update patterns and preview
-            self.video_list.update_rename_patterns(current_find, current_replace, current_case)
-        else:
-            print("DEBUG: No changes detected")
-        
-        # Schedule next check
-        self.schedule_rename_check()
-    
-    def stop_rename_monitoring(self):
-        """Stop the rename monitoring."""
-        print("DEBUG: stop_rename_monitoring called")
-        self.rename_monitoring_active = False
-        # Clean up old timer if it exists
-        if hasattr(self, 'rename_monitor_timer') and self.rename_monitor_timer:
-            print("DEBUG: Stopping old timer")
-            self.rename_monitor_timer.Stop()
-            self.rename_monitor_timer = None
-        else:
-            print("DEBUG: No old timer to stop")
-    
     def OnRenameTextChange(self, event):
-        """Handle changes in rename text fields (legacy method for compatibility)."""
-        # This method is kept for compatibility but the CallLater monitoring approach is used instead
-        pass
+        """Handle changes in the rename fields, debouncing rapid typing."""
+        if event.GetEventType() == wx.EVT_KILL_FOCUS.typeId:
+            event.Skip()  # Let the control finish losing focus
+        self.rename_timer.Stop()
+        if event.GetEventType() == wx.EVT_TEXT_ENTER.typeId:
+            self.update_rename_preview()
+        else:
+            self.rename_timer.Start(300, wx.TIMER_ONE_SHOT)  # 300ms delay
     
     def OnRenameTimerExpired(self, event):
-        """Handle timer expiration and update rename preview (legacy method)."""
-        # This method is kept for compatibility but not used with new CallLater approach
-        pass
+        """Handle the timer event for debounced rename preview updates."""
+        self.update_rename_preview()
     
     def update_rename_preview(self):
-        """Update the rename preview based on current input."""
+        """Update the rename preview if the rename fields changed."""
         if not hasattr(self, 'rename_bar') or not self.rename_bar.IsShown():
             return
-            
-        find_pattern = self.rename_find_text.GetValue()
-        replace_pattern = self.rename_replace_text.GetValue()
-        case_sensitive = self.rename_case_cb.GetValue()
-        
-        # Debug print to verify this method is being called with correct values
-        print(f"DEBUG: update_rename_preview - find='{find_pattern}', replace='{replace_pattern}', case={case_sensitive}")
-        
-        self.video_list.set_rename_mode(True, find_pattern, replace_pattern, case_sensitive)
+        patterns = (self.rename_find_text.GetValue(),
+                    self.rename_replace_text.GetValue(),
+                    self.rename_case_cb.GetValue())
+        if patterns != self.last_rename_patterns:
+            self.last_rename_patterns = patterns
+            self.video_list.update_rename_patterns(*patterns)
     
     def OnApplyRename(self, event):
         """Apply the rename operations."""
@@ -1277,10 +1449,7 @@ class VideoListPanel(wx.Panel):
         warning_count = 0
         overwrite_conflicts = []
         
-        for i in range(self.video_list.GetItemCount()):
-            original_name = self.video_list.GetItemText(i, 0)
-            preview = self.video_list.GetItemText(i, 1)  # Rename Preview is now column 1
-            
+        for original_name, preview in self.video_list.rename_previews():
             if preview and not preview.startswith("ERROR:") and preview != "No change":
                 # Extract the new name (handle warnings)
                 if preview.startswith("WARNING: "):
@@ -1371,11 +1540,7 @@ class VideoListPanel(wx.Panel):
     def OnDeleteSelected(self, event):
         """Handle delete selected files menu item."""
         # Get selected files
-        selected_files = []
-        for i in range(self.video_list.GetItemCount()):
-            if self.video_list.IsItemChecked(i):
-                filename = self.video_list.GetItemText(i, 0)
-                selected_files.append(filename)
+        selected_files = self.video_list.checked_filenames()
         
         if not selected_files:
             wx.MessageBox("No files selected for deletion.", "Nothing to Delete", 
@@ -1383,7 +1548,7 @@ class VideoListPanel(wx.Panel):
             return
         
         # Show confirmation dialog with file list
-        file_list = "\n".join([f"• {f}" for f in selected_files[:20]])  # Show first 20
+        file_list = "\n".join(f"• {f}" for f in islice(selected_files, 20))  # Show first 20
         if len(selected_files) > 20:
             file_list += f"\n... and {len(selected_files) - 20} more files"
         
@@ -1391,44 +1556,54 @@ class VideoListPanel(wx.Panel):
         
         dlg = wx.MessageDialog(self, msg, "Confirm Delete", 
                               wx.YES_NO | wx.NO_DEFAULT | wx.ICON_WARNING)
+        confirmed = dlg.ShowModal() == wx.ID_YES
+        dlg.Destroy()
+        working_dir = self.app_state.working_dir
+        if not confirmed or not working_dir:
+            return
         
-        if dlg.ShowModal() == wx.ID_YES:
-            # Perform deletion
-            success_count = 0
-            errors = []
+        # Delete on a worker thread so the UI keeps painting; the progress dialog
+        # is app-modal, so the list can't be changed while files are going away
+        progress = wx.ProgressDialog("Deleting Files", f"Deleting {len(selected_files)} file(s)...",
+                                     maximum=len(selected_files), parent=self,
+                                     style=wx.PD_APP_MODAL | wx.PD_ELAPSED_TIME)
+        
+        def delete_worker():
+            last_update = 0.0
             
-            for filename in selected_files:
-                if self.app_state.working_dir:
-                    file_path = self.app_state.working_dir / filename
-                    try:
-                        if file_path.exists():
-                            file_path.unlink()  # Delete the file
-                            success_count += 1
-                            logger.info(f"Deleted file: {filename}")
-                        else:
-                            errors.append(f"{filename}: File not found")
-                    except Exception as e:
-                        errors.append(f"{filename}: {e}")
-                        logger.error(f"Failed to delete {filename}: {e}")
+            def on_progress(done):
+                nonlocal last_update
+                now = time.monotonic()
+                if now - last_update >= 0.1:  # Don't flood the event queue
+                    last_update = now
+                    wx.CallAfter(progress.Update, done)
             
-            # Show results
-            if not errors:
-                wx.MessageBox(f"Successfully deleted {success_count} file(s).", 
-                             "Delete Complete", wx.OK | wx.ICON_INFORMATION)
-            else:
-                error_summary = f"Deleted {success_count} file(s) successfully.\n{len(errors)} deletion(s) failed:\n\n"
-                error_summary += "\n".join(errors[:5])  # Show first 5 errors
-                if len(errors) > 5:
-                    error_summary += f"\n... and {len(errors) - 5} more errors"
-                
-                wx.MessageBox(error_summary, "Delete Completed with Errors", 
-                             wx.OK | wx.ICON_WARNING)
+            deleted, errors, failed = _delete_files(working_dir, selected_files, on_progress)
+            wx.CallAfter(self._finish_delete, progress, deleted, errors, failed)
+        
+        threading.Thread(target=delete_worker, daemon=True).start()
+    
+    def _finish_delete(self, progress, deleted, errors, failed):
+        """Close the delete progress dialog and report the results."""
+        progress.Destroy()
+        success_count = len(deleted)
+        
+        # Show results
+        if not failed:
+            wx.MessageBox(f"Successfully deleted {success_count} file(s).", 
+                         "Delete Complete", wx.OK | wx.ICON_INFORMATION)
+        else:
+            error_summary = f"Deleted {success_count} file(s) successfully.\n{failed} deletion(s) failed:\n\n"
+            error_summary += "\n".join(errors)  # Only the first few are kept
+            if failed > len(errors):
+                error_summary += f"\n... and {failed - len(errors)} more errors"
             
-            # Refresh the list to remove deleted files
-            if success_count > 0:
-                self.refresh()
+            wx.MessageBox(error_summary, "Delete Completed with Errors", 
+                         wx.OK | wx.ICON_WARNING)
         
-        dlg.Destroy()
+        # Drop the deleted files from the list; we know which ones went, so there's no need to rescan
+        if deleted:
+            self.video_list.remove_items_by_name(deleted)
     
     def ApplyFilter(self):
         """Apply the current filter to the video list."""
@@ -1475,12 +1650,7 @@ class VideoListPanel(wx.Panel):
         if not self.app_state.working_dir:
             return []
             
-        visible_files = []
-        for i in range(self.video_list.GetItemCount()):
-            rel_path = self.video_list.GetItemText(i, 0)
-            abs_path = str(self.app_state.working_dir / rel_path)
-            visible_files.append(abs_path)
-        return visible_files
+        return self.video_list.visible_paths()
 
     def toggle_inline_rename(self):
         """Toggle the inline rename mode."""
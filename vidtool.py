@@ -1,76 +1,94 @@
 import argparse
+import fnmatch
 import os
 import pathlib
 
 import modules.video as video
 from modules.logging_config import get_logger, setup_logging
 
-# Initialize logging for CLI
-setup_logging(log_to_console=True, log_to_file=False)  # CLI only needs console output
 logger = get_logger('cli')
 
-global_parser = argparse.ArgumentParser(
-    prog='vidtool',
-    description='Tool for batch reencoding, getting video info, and renaming videos with resolution.'
-    )
-
-subparsers = global_parser.add_subparsers(title='subcommands', dest='which')
-
-# reencode
-parser_reencode = subparsers.add_parser('reencode', help='Reencode a file/files with the extension specified, appending a suffix to the filename.')
-parser_reencode.add_argument("pattern", help='Pattern to match input files. "*.avi" for example.')
-parser_reencode.add_argument("ext", help="File extension to use for output files. Determines the codec used.")
-parser_reencode.add_argument("suffix", help="Suffix to add after the file name and before the extension.")
-parser_reencode.add_argument("--av-copy-only", action="store_true", help="Copy audio and video streams only, strip everything else, and make an exact copy.")
-parser_reencode.add_argument("--x265", action="store_true", help="Force using x265, and set crf to 28.")
-parser_reencode.add_argument("--vcodec", nargs="?", help="Specify a video codec (or use copy to copy rather than reencode video).")
-parser_reencode.add_argument("--acodec", nargs="?", help="Specify a audio codec (or use copy to copy rather than reencode audio).")
-parser_reencode.add_argument("--strip-video", action="store_true", help="Strip video streams.")
-parser_reencode.add_argument("--strip-audio", action="store_true", help="Strip audio streams.")
-parser_reencode.add_argument("--strip-subs", action="store_true", help="Strip subtitle streams.")
-parser_reencode.add_argument("--strip-data", action="store_true", help="Strip data streams.")
-parser_reencode.add_argument("--custom-flags", nargs="*", help="Custom flags to use with ffmpeg, enclosed in quotes.")
-parser_reencode.add_argument("--batch", action="store_true", help='Batch reencode all files in a directory matching a pattern, such as "*.avi".')
-parser_reencode.add_argument("--fix-resolution", action="store_true", help="Odd numbered resolution fix. Scale to nearest even resolution.")
-parser_reencode.add_argument("--fix-errors", action="store_true", help="Attempt to fix errors. Same as --err_detect ignore_err in ffmpeg.")
-parser_reencode.add_argument("--ffmpeg-path", default = "ffmpeg", help="Path to ffmpeg binary.")
-parser_reencode.add_argument("--ffprobe-path", default = "ffprobe", help="Path to ffprobe binary.")
-int_group = parser_reencode.add_mutually_exclusive_group()
-int_group.add_argument("--force", action="store_true", help="Force overwriting existing files.")
-int_group.add_argument("--no-clobber", action="store_true", help="Don't overwriting existing files.")
-
-# rename
-parser_rename = subparsers.add_parser('rename', help='Rename a file (or all files in the current directory) to include video resolution.')
-parser_rename.add_argument("file", nargs='?', help="Filename. Required if not using --batch.", default = "")
-parser_rename.add_argument("--batch", action="store_true", help="Batch rename all files in a directory.")
-parser_rename.add_argument("--ffmpeg-path", default = "ffmpeg", help="Path to ffmpeg binary.")
-parser_rename.add_argument("--ffprobe-path", default = "ffprobe", help="Path to ffprobe binary.")
-
-# info
-parser_info = subparsers.add_parser('info', help='Get information about a video file.')
-parser_info.add_argument("file", help="Video file to get information about.")
-parser_info.add_argument("--json", action="store_true", help="Output information in JSON format.")
-parser_info.add_argument("--ffmpeg-path", default = "ffmpeg", help="Path to ffmpeg binary.")
-parser_info.add_argument("--ffprobe-path", default = "ffprobe", help="Path to ffprobe binary.")
-
-args = global_parser.parse_args()
-
-if hasattr(args,"ffprobe_path"):
-    video.ffprobe_bin = args.ffprobe_path
-else:
-    video.ffprobe_bin = "ffprobe"
-
-if hasattr(args,"ffmpeg_path"):
-    video.ffmpeg_bin = args.ffmpeg_path
-else:
-    video.ffmpeg_bin = "ffmpeg"
-
-
-def reencode(video_file):
+# Directory -> names of the entries in it, for directories batch_files has listed, so
+# reencode's output-exists check doesn't need a stat per file
+_listed_dirs = {}
+
+
+def build_parser():
+    """Build the argument parser for the vidtool command line."""
+    global_parser = argparse.ArgumentParser(
+        prog='vidtool',
+        description='Tool for batch reencoding, getting video info, and renaming videos with resolution.'
+        )
+
+    subparsers = global_parser.add_subparsers(title='subcommands', dest='which')
+
+    # reencode
+    parser_reencode = subparsers.add_parser('reencode', help='Reencode a file/files with the extension specified, appending a suffix to the filename.')
+    parser_reencode.add_argument("pattern", help='Pattern to match input files. "*.avi" for example.')
+    parser_reencode.add_argument("ext", help="File extension to use for output files. Determines the codec used.")
+    parser_reencode.add_argument("suffix", help="Suffix to add after the file name and before the extension.")
+    parser_reencode.add_argument("--av-copy-only", action="store_true", help="Copy audio and video streams only, strip everything else, and make an exact copy.")
+    parser_reencode.add_argument("--x265", action="store_true", help="Force using x265, and set crf to 28.")
+    parser_reencode.add_argument("--vcodec", nargs="?", help="Specify a video codec (or use copy to copy rather than reencode video).")
+    parser_reencode.add_argument("--acodec", nargs="?", help="Specify a audio codec (or use copy to copy rather than reencode audio).")
+    parser_reencode.add_argument("--strip-video", action="store_true", help="Strip video streams.")
+    parser_reencode.add_argument("--strip-audio", action="store_true", help="Strip audio streams.")
+    parser_reencode.add_argument("--strip-subs", action="store_true", help="Strip subtitle streams.")
+    parser_reencode.add_argument("--strip-data", action="store_true", help="Strip data streams.")
+    parser_reencode.add_argument("--custom-flags", nargs="*", help="Custom flags to use with ffmpeg, enclosed in quotes.")
+    parser_reencode.add_argument("--batch", action="store_true", help='Batch reencode all files in a directory matching a pattern, such as "*.avi".')
+    parser_reencode.add_argument("--fix-resolution", action="store_true", help="Odd numbered resolution fix. Scale to nearest even resolution.")
+    parser_reencode.add_argument("--fix-errors", action="store_true", help="Attempt to fix errors. Same as --err_detect ignore_err in ffmpeg.")
+    parser_reencode.add_argument("--ffmpeg-path", default = "ffmpeg", help="Path to ffmpeg binary.")
+    parser_reencode.add_argument("--ffprobe-path", default = "ffprobe", help="Path to ffprobe binary.")
+    int_group = parser_reencode.add_mutually_exclusive_group()
+    int_group.add_argument("--force", action="store_true", help="Force overwriting existing files.")
+    int_group.add_argument("--no-clobber", action="store_true", help="Don't overwriting existing files.")
+
+    # rename
+    parser_rename = subparsers.add_parser('rename', help='Rename a file (or all files in the current directory) to include video resolution.')
+    parser_rename.add_argument("file", nargs='?', help="Filename. Required if not using --batch.", default = "")
+    parser_rename.add_argument("--batch", action="store_true", help="Batch rename all files in a directory.")
+    parser_rename.add_argument("--ffmpeg-path", default = "ffmpeg", help="Path to ffmpeg binary.")
+    parser_rename.add_argument("--ffprobe-path", default = "ffprobe", help="Path to ffprobe binary.")
+
+    # info
+    parser_info = subparsers.add_parser('info', help='Get information about a video file.')
+    parser_info.add_argument("file", help="Video file to get information about.")
+    parser_info.add_argument("--json", action="store_true", help="Output information in JSON format.")
+    parser_info.add_argument("--ffmpeg-path", default = "ffmpeg", help="Path to ffmpeg binary.")
+    parser_info.add_argument("--ffprobe-path", default = "ffprobe", help="Path to ffprobe binary.")
+
+    return global_parser
+
+
+def batch_files(pattern):
+    """Return the files in the current directory matching pattern, like glob() but with one scandir pass."""
+    if os.sep in pattern or (os.altsep and os.altsep in pattern):
+        # Patterns that reach into other directories still need glob
+        return list(pathlib.Path(os.getcwd()).glob(pattern))
+    cwd = os.getcwd()
+    with os.scandir(cwd) as it:
+        entries = list(it)
+    _listed_dirs[cwd] = {entry.name for entry in entries}
+    paths = {entry.name: entry.path for entry in entries if entry.is_file()}
+    return [paths[name] for name in fnmatch.filter(paths, pattern)]
+
+
+def output_exists(path):
+    """Return whether path exists, from batch_files' listing when it covers path's directory."""
+    directory, name = os.path.split(os.fspath(path))
+    names = _listed_dirs.get(directory)
+    if names is None:
+        return os.path.exists(path)
+    return name in names
+
+
+def reencode(video_file, args):
     v = video.encode()
     v.add_input(video_file)
     v.add_output_from_input(file_append = args.suffix, file_extension = args.ext)
-    if pathlib.Path(v.output).exists():
+    if output_exists(v.output):
         if args.force:
             logger.info(f"Overwriting existing file '{v.output}'")
         elif args.no_clobber:
@@ -118,31 +136,61 @@ def reencode(video_file):
     if args.custom_flags: v.custom_flags(args.custom_flags)
 
     v.reencode()
+    # Later inputs in the same batch may map to this output too
+    directory, name = os.path.split(os.fspath(v.output))
+    if directory in _listed_dirs:
+        _listed_dirs[directory].add(name)
 
-if args.which == 'reencode':
-    if args.batch:
-        print(f"Reencode '{args.pattern}' to '*{args.ext}.{args.suffix}'.")
-        for video_file in pathlib.Path(os.getcwd()).glob(f'{args.pattern}'):
-            reencode(video_file)
+
+def main(argv=None):
+    """Parse argv (default: sys.argv) and run the chosen subcommand."""
+    # Initialize logging for CLI
+    setup_logging(log_to_console=True, log_to_file=False)  # CLI only needs console output
+
+    global_parser = build_parser()
+    args = global_parser.parse_args(argv)
+
+    # Listings from an earlier run in this process may be out of date
+    _listed_dirs.clear()
+
+    if hasattr(args,"ffprobe_path"):
+        video.ffprobe_bin = args.ffprobe_path
     else:
-        reencode(args.pattern)
+        video.ffprobe_bin = "ffprobe"
 
-elif args.which == 'rename':
-    if args.batch:
-        logger.info("Batch rename files to include resolution.")
-        video.batch_rename(args.file)
+    if hasattr(args,"ffmpeg_path"):
+        video.ffmpeg_bin = args.ffmpeg_path
     else:
-        if args.file == "":
-            logger.error("File required if not using --batch.")
-            exit(1)
-        logger.info(f"Rename '{args.file}' to include resolution.")
+        video.ffmpeg_bin = "ffmpeg"
+
+    if args.which == 'reencode':
+        if args.batch:
+            print(f"Reencode '{args.pattern}' to '*{args.ext}.{args.suffix}'.")
+            for video_file in batch_files(args.pattern):
+                reencode(video_file, args)
+        else:
+            reencode(args.pattern, args)
+
+    elif args.which == 'rename':
+        if args.batch:
+            logger.info("Batch rename files to include resolution.")
+            video.batch_rename(args.file)
+        else:
+            if args.file == "":
+                logger.error("File required if not using --batch.")
+                exit(1)
+            logger.info(f"Rename '{args.file}' to include resolution.")
+            v = video.info(args.file)
+            v.rename_resolution()
+    elif args.which == 'info':
         v = video.info(args.file)
-        v.rename_resolution()
-elif args.which == 'info':
-    v = video.info(args.file)
-    if args.json:
-        v.print_json()
+        if args.json:
+            v.print_json()
+        else:
+            v.print_info()
     else:
-        v.print_info()
-else:
-    global_parser.print_help()
+        global_parser.print_help()
+
+
+if __name__ == '__main__':
+    main()